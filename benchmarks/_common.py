@@ -0,0 +1,19 @@
+"""Shared setup for the benchmark scripts: the repository root on `sys.path` and a best-of timer."""
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
+
+
+def best_of(fn, repeat):
+    """Fastest of `repeat` calls to `fn`, and the last result."""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        times.append(time.perf_counter() - start)
+    return min(times), result
@@ -0,0 +1,51 @@
+"""Compare a per-row `combinations` loop with ComboMiner for 3- and 4-player combos.
+
+Run from the repository root:
+
+    python benchmarks/bench_itemsets.py
+"""
+import glob
+import os
+from collections import Counter
+from itertools import combinations
+
+from _common import ROOT, best_of
+from dawg_bowl import ComboMiner, build_entries
+
+MIN_SUPPORT = 10
+
+
+def loop_counts(entries_df, size):
+    all_counts, top_counts = Counter(), Counter()
+    players = entries_df[[f"Player {i}" for i in range(1, 7)]].to_numpy()
+    for row, top in zip(players, entries_df["Top_1%"].to_numpy()):
+        for combo in combinations(sorted(set(row)), size):
+            all_counts[combo] += 1
+            top_counts[combo] += top
+    return {combo: (count, top_counts[combo]) for combo, count in all_counts.items() if count >= MIN_SUPPORT}
+
+
+def main():
+    week_files = sorted(glob.glob(os.path.join(ROOT, "*_Week_*_DBQ.csv")))
+    entries_df = build_entries(week_files, os.path.join(ROOT, "Position List.xlsx"))
+    tier_masks = {"Top 1%": entries_df["Top_1%"].to_numpy()}
+
+    build_time, miner = best_of(lambda: ComboMiner.from_entries(entries_df), 3)
+    print(f"entries:       {len(entries_df)}")
+    print(f"miner build:   {build_time * 1000:.1f} ms")
+    for size in (3, 4):
+        loop_time, expected = best_of(lambda: loop_counts(entries_df, size), 1)
+        mine_time, table = best_of(lambda: miner.combo_table(size, tier_masks, min_support=MIN_SUPPORT), 3)
+        actual = {
+            tuple(row[:size]): (row["All Entries"], row["Top 1%"])
+            for _, row in table.iterrows()
+        }
+        assert actual == expected
+        print(f"size {size} ({len(table)} combos, support >= {MIN_SUPPORT}):")
+        print(f"  combinations loop: {loop_time * 1000:.1f} ms")
+        print(f"  ComboMiner:        {mine_time * 1000:.1f} ms")
+        print(f"  speedup:           {loop_time / mine_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
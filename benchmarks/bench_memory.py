@@ -0,0 +1,24 @@
+"""Report entries_df memory before and after the compact categorical layout.
+
+Run from the repository root:
+
+    python benchmarks/bench_memory.py
+"""
+import glob
+import os
+
+from _common import ROOT
+from dawg_bowl import build_entries, compact_entries, memory_report
+
+
+def main():
+    week_files = sorted(glob.glob(os.path.join(ROOT, "*_Week_*_DBQ.csv")))
+    entries_df = build_entries(week_files, os.path.join(ROOT, "Position List.xlsx"))
+    report = memory_report(entries_df, compact_entries(entries_df))
+
+    print(f"entries: {len(entries_df)}")
+    print((report[["Before", "After"]] / 1024).round(1).join(report["Saved (%)"].round(1)).to_string())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare serial and process-pool week loading on the bundled season and a synthetic one.
+
+Run from the repository root:
+
+    python benchmarks/bench_parallel.py [--workers 2 4] [--entries 50000]
+
+"cold" is the first call at a pool size, including spawning the workers;
+"warm" reuses the pool, as every later upload in the same server does.
+"""
+import argparse
+import glob
+import os
+import tempfile
+
+import pandas as pd
+
+from _common import ROOT, best_of
+from dawg_bowl import build_entries_parallel, write_contest
+
+
+def compare(label, week_files, positions_file, workers_options):
+    serial_time, expected = best_of(lambda: build_entries_parallel(week_files, positions_file, workers=1), 3)
+    print(f"{label}: {len(expected)} entries in {len(week_files)} weeks ({os.cpu_count()} CPUs)")
+    print(f"  serial:             {serial_time * 1000:8.1f} ms")
+    for workers in workers_options:
+        cold_time, actual = best_of(lambda: build_entries_parallel(week_files, positions_file, workers=workers), 1)
+        warm_time, actual = best_of(lambda: build_entries_parallel(week_files, positions_file, workers=workers), 3)
+        pd.testing.assert_frame_equal(actual, expected)
+        print(
+            f"  {workers} workers:  cold {cold_time * 1000:8.1f} ms  warm {warm_time * 1000:8.1f} ms"
+            f"  ({serial_time / warm_time:.2f}x serial)"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[2, 4])
+    parser.add_argument("--weeks", type=int, default=7)
+    parser.add_argument("--entries", type=int, default=50000, help="Synthetic entries per week")
+    args = parser.parse_args()
+
+    week_files = sorted(glob.glob(os.path.join(ROOT, "*_Week_*_DBQ.csv")))
+    compare("bundled season", week_files, os.path.join(ROOT, "Position List.xlsx"), args.workers)
+    with tempfile.TemporaryDirectory() as data_dir:
+        week_files, positions_file = write_contest(data_dir, args.weeks, args.entries)
+        compare("synthetic season", week_files, positions_file, args.workers)
+
+
+if __name__ == "__main__":
+    main()
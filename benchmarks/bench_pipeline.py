@@ -0,0 +1,167 @@
+"""Time every pipeline stage on synthetic seasons from 5k to 1M entries.
+
+Run from the repository root:
+
+    python benchmarks/bench_pipeline.py [--sizes 5000 50000 250000 1000000] [--output pipeline_benchmark.json]
+
+Each size is a full season of synthetic DBQ files (see `dawg_bowl.synthetic`)
+split evenly over `--weeks`. Generation time is not counted. Results are
+written as JSON so runs from different releases can be diffed.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import resource
+import sys
+import tempfile
+import time
+
+import numpy as np
+import pandas as pd
+
+import _common  # noqa: F401  (repository root on sys.path)
+from dawg_bowl import (
+    ALL_ENTRIES,
+    ALL_WEEKS,
+    AggregateCubes,
+    ComboMatrix,
+    ComboMiner,
+    EntryIndex,
+    StackEngine,
+    StreamingReport,
+    TrendEngine,
+    add_total_entries,
+    anchor_flow,
+    assign_roles,
+    compact_entries,
+    elite_masks,
+    map_positions,
+    player_rate_table,
+    read_positions,
+    read_weeks,
+    stack_pair_table,
+    stack_table,
+    stack_type_table,
+    stream_aggregates,
+    tag_percentile_tiers,
+    tier_label_masks,
+    user_table,
+)
+from dawg_bowl.cache import PIPELINE_VERSION
+from dawg_bowl.synthetic import write_contest
+
+DEFAULT_SIZES = [5_000, 50_000, 250_000, 1_000_000]
+
+
+class StageTimer:
+    def __init__(self):
+        self.stages = {}
+
+    def __call__(self, name, fn, *args, **kwargs):
+        start = time.perf_counter()
+        result = fn(*args, **kwargs)
+        self.stages[name] = round(time.perf_counter() - start, 4)
+        return result
+
+
+def peak_rss_mb():
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(rss / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def run_pipeline(week_files, positions_file, min_support):
+    timer = StageTimer()
+
+    # Ingestion, in the order `enrich_entries` runs it
+    entries_df = timer("read", read_weeks, week_files)
+    position_df = timer("read_positions", read_positions, positions_file)
+    entries_df = timer("map_positions", map_positions, entries_df, position_df)
+    entries_df = timer("assign_roles", assign_roles, entries_df)
+    entries_df = timer("total_entries", add_total_entries, entries_df)
+    entries_df = timer("tier_tagging", tag_percentile_tiers, entries_df)
+    entries_df = timer("compact_layout", compact_entries, entries_df)
+
+    # Per-dataset structures the dashboard caches
+    entry_index = timer("entry_index", EntryIndex.from_entries, entries_df)
+    stack_engine = timer("stack_engine", StackEngine.from_entries, entries_df)
+    cubes = timer("aggregate_cubes", AggregateCubes.from_entries, entries_df, labels=stack_engine.labels)
+    combo_matrix = timer("combo_matrix", ComboMatrix.from_entries, entries_df)
+    combo_miner = timer("combo_miner", ComboMiner.from_entries, entries_df)
+    trend_engine = timer("trend_engine", lambda: TrendEngine().update(entries_df))
+
+    # One view per tab, as rendered with default filters
+    top_mask = entries_df["Top_1%"].to_numpy()
+    timer("tab1_user_summary", user_table, cubes, ALL_WEEKS)
+    timer("tab2_heatmap", cubes.position_counts, ALL_WEEKS, ALL_ENTRIES)
+    timer("tab3_anchor_flow", lambda: anchor_flow(cubes.anchor_counts("RB", ALL_WEEKS, ALL_ENTRIES)))
+    timer("tab4_pair_combos", combo_matrix.combo_table, top_mask)
+    timer("tab4_triple_combos", combo_miner.combo_table, 3, tier_label_masks(entries_df), min_support)
+    timer("tab5_player_rates", player_rate_table, cubes, ALL_WEEKS, ALL_ENTRIES)
+    timer("tab6_stacking", stack_table, cubes, ALL_WEEKS, "Top 1%")
+    timer("tab7_stack_types", stack_type_table, cubes, ALL_WEEKS, "Top 1%")
+    timer("tab7_stack_pairs", stack_pair_table, stack_engine, elite_masks(entries_df))
+    timer("tab9_player_trends", trend_engine.trend_table, "players")
+    timer("search_player", entry_index.rows, players=[entries_df["Player 1"].iloc[0]])
+
+    # Chunked path behind `python -m dawg_bowl.report --stream`, read from the files again
+    aggregates = timer("stream_aggregates", stream_aggregates, week_files, positions_file)
+    timer("stream_report_tables", lambda: StreamingReport(aggregates).tables())
+
+    return timer.stages
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="Total entries per season")
+    parser.add_argument("--weeks", type=int, default=7)
+    parser.add_argument("--players", type=int, default=300)
+    parser.add_argument("--stack-rate", type=float, default=0.4)
+    parser.add_argument("--min-support", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", default="pipeline_benchmark.json")
+    args = parser.parse_args()
+
+    results = []
+    for size in args.sizes:
+        with tempfile.TemporaryDirectory() as data_dir:
+            week_files, positions_file = write_contest(
+                data_dir, args.weeks, size // args.weeks, args.players, args.stack_rate, args.seed
+            )
+            stages = run_pipeline(week_files, positions_file, args.min_support)
+        results.append({
+            "entries": size // args.weeks * args.weeks,
+            "weeks": args.weeks,
+            "players": args.players,
+            "stages": stages,
+            "total_seconds": round(sum(stages.values()), 4),
+            "peak_rss_mb": peak_rss_mb(),
+        })
+
+        print(f"{results[-1]['entries']:>9} entries  total {results[-1]['total_seconds']:8.2f} s  peak RSS {results[-1]['peak_rss_mb']:.0f} MB")
+        for name, seconds in stages.items():
+            print(f"    {name:<20} {seconds * 1000:10.1f} ms")
+
+    report = {
+        "benchmark": "pipeline",
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "pipeline_version": PIPELINE_VERSION,
+        "environment": {
+            "python": platform.python_version(),
+            "pandas": pd.__version__,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "config": {"stack_rate": args.stack_rate, "min_support": args.min_support, "seed": args.seed},
+        "results": results,
+    }
+    with open(args.output, "w") as fh:
+        json.dump(report, fh, indent=2)
+    print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,42 @@
+"""Compare row-wise and vectorized role assignment on the bundled season.
+
+Run from the repository root:
+
+    python benchmarks/bench_roles.py
+"""
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+from _common import ROOT, best_of
+from dawg_bowl.ingest import assign_roles, assign_roles_rowwise, map_positions, read_positions, read_weeks
+
+
+def random_positions(n, seed=0):
+    rng = np.random.default_rng(seed)
+    values = rng.choice(["QB", "RB", "WR", "TE", "Unknown"], size=(n, 6))
+    return pd.DataFrame(values, columns=[f"Pos {i}" for i in range(1, 7)])
+
+
+def main():
+    week_files = sorted(glob.glob(os.path.join(ROOT, "*_Week_*_DBQ.csv")))
+    entries_df = map_positions(read_weeks(week_files), read_positions(os.path.join(ROOT, "Position List.xlsx")))
+
+    row_time, expected = best_of(lambda: assign_roles_rowwise(entries_df), 1)
+    vec_time, actual = best_of(lambda: assign_roles(entries_df), 5)
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+
+    # Random lineups exercise missing roles (NaN / float64 output)
+    fuzz = random_positions(5000)
+    pd.testing.assert_frame_equal(assign_roles(fuzz), assign_roles_rowwise(fuzz), check_exact=True)
+
+    print(f"entries:    {len(entries_df)}")
+    print(f"row-wise:   {row_time * 1000:.1f} ms")
+    print(f"vectorized: {vec_time * 1000:.1f} ms")
+    print(f"speedup:    {row_time / vec_time:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
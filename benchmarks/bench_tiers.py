@@ -0,0 +1,35 @@
+"""Compare per-week apply and grouped-transform tier tagging on the bundled season.
+
+Run from the repository root:
+
+    python benchmarks/bench_tiers.py
+"""
+import glob
+import os
+
+import pandas as pd
+
+from _common import ROOT, best_of
+from dawg_bowl import TIERS, read_weeks, tag_percentile_tiers, tag_percentile_tiers_groupby
+
+EXTENDED_TIERS = {**TIERS, "Top 5%": ("Top_5%", 0.05), "Top 10%": ("Top_10%", 0.10)}
+
+
+def main():
+    week_files = sorted(glob.glob(os.path.join(ROOT, "*_Week_*_DBQ.csv")))
+    entries_df = read_weeks(week_files)
+
+    apply_time, expected = best_of(lambda: tag_percentile_tiers_groupby(entries_df.copy()), 5)
+    vec_time, actual = best_of(lambda: tag_percentile_tiers(entries_df.copy()), 5)
+    pd.testing.assert_frame_equal(actual, expected, check_exact=True)
+    ext_time, _ = best_of(lambda: tag_percentile_tiers(entries_df.copy(), EXTENDED_TIERS), 5)
+
+    print(f"entries:              {len(entries_df)}")
+    print(f"groupby apply:        {apply_time * 1000:.1f} ms")
+    print(f"grouped transform:    {vec_time * 1000:.1f} ms")
+    print(f"  + Top 5% / Top 10%: {ext_time * 1000:.1f} ms")
+    print(f"speedup:              {apply_time / vec_time:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
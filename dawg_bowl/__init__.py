@@ -0,0 +1,72 @@
+import importlib
+
+from .cache import EntriesCache, content_key, load_entries
+from .cubes import ALL_ENTRIES, ALL_ROUNDS, ALL_WEEKS, AggregateCubes, PlayerRoundCounts, position_counts, tier_mask
+from .index import EntryIndex
+from .ingest import (
+    NamedBytes,
+    add_total_entries,
+    assign_roles,
+    build_entries,
+    enrich_entries,
+    enrich_week,
+    map_positions,
+    read_positions,
+    read_week,
+    read_weeks,
+    tag_percentile_tiers,
+    tag_percentile_tiers_groupby,
+    tag_week_tiers,
+    week_label,
+)
+from .itemsets import ComboMiner, tier_label_masks
+from .layout import compact_entries, encode_columns, memory_report, shared_dtype
+from .parallel import build_entries_parallel, default_workers, map_weeks
+from .perf import PerfRecorder, get_recorder, set_recorder, stage
+from .roles import ROLE_COLUMNS, compute_roles, roles_frame
+from .stacks import StackEngine, elite_masks, classify_stack, detect_stack, stack_labels, stack_labels_rowwise
+from .tables import PAGE_SIZES, page_count, table_page, top_positions
+from .tiers import FLAG_COLUMNS, TIER_COLUMNS, TIER_LABELS, TIERS, tag_tiers, tier_cutoffs
+from .views import ViewCache
+
+# Modules with a `python -m` entry point are imported on first use: importing them
+# here would make `-m` warn that they were already loaded by the package. Modules
+# that pull in matplotlib/seaborn or scipy are lazy too, so spawned worker
+# processes that only parse weeks load pandas and numpy, not the whole stack
+_LAZY_EXPORTS = {
+    "charts": ["CHART_RENDERERS", "anchor_flow_png", "anchor_flow_spec", "heatmap_png", "heatmap_spec", "table_key"],
+    "combos": ["ComboMatrix"],
+    "report": [
+        "RATE_COLUMNS",
+        "DashboardReport",
+        "StreamingReport",
+        "add_rates",
+        "add_stack_pair_rates",
+        "anchor_counts",
+        "anchor_flow",
+        "heatmap_counts",
+        "player_rate_table",
+        "stack_pair_table",
+        "stack_table",
+        "stack_type_table",
+        "user_table",
+    ],
+    "scanner": ["scan_entries", "scan_week", "scan_weeks"],
+    "store": ["SeasonStore"],
+    "streaming": ["StreamingAggregates", "count_entries", "iter_week_chunks", "stream_aggregates"],
+    "synthetic": ["ContestGenerator", "synthetic_positions", "write_contest"],
+    "trends": ["TREND_WINDOW", "TrendEngine", "week_fingerprints", "week_totals"],
+}
+_LAZY_MODULES = {name: module for module, names in _LAZY_EXPORTS.items() for name in names}
+
+
+def __getattr__(name):
+    if name not in _LAZY_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{_LAZY_MODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_MODULES))
@@ -0,0 +1,128 @@
+import glob
+import hashlib
+import os
+import threading
+
+import pandas as pd
+
+from .ingest import file_bytes, file_name
+from .layout import compact_entries
+from .parallel import build_entries_parallel
+
+# Bump whenever enrichment output changes so stale on-disk entries are ignored
+PIPELINE_VERSION = "2"
+
+
+def content_key(week_files, positions_file=None):
+    """Hash file names and contents into a stable cache key.
+
+    Week files are hashed in sorted order so the key does not depend on the
+    order in which they were uploaded. `positions_file` is optional for
+    callers that only read the weekly CSVs (the trait scanner).
+    """
+    digest = hashlib.sha256(PIPELINE_VERSION.encode())
+    for name, data in sorted((file_name(f), file_bytes(f)) for f in week_files):
+        digest.update(name.encode())
+        digest.update(hashlib.sha256(data).digest())
+    if positions_file is not None:
+        digest.update(hashlib.sha256(file_bytes(positions_file)).digest())
+    return digest.hexdigest()
+
+
+class EntriesCache:
+    """Content-addressed LRU cache of enriched `entries_df` frames.
+
+    Up to `max_items` frames are kept in memory and, when `cache_dir` is
+    set, pickled to disk so a fresh session can skip parsing. The disk store
+    keeps the `max_disk_items` most recently used pickles; older ones are
+    deleted when a new frame is written.
+    """
+
+    def __init__(self, cache_dir=None, max_items=4, max_disk_items=16):
+        self.cache_dir = cache_dir
+        self.max_items = max_items
+        self.max_disk_items = max_disk_items
+        self._frames = {}
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"entries_{key}.pkl")
+
+    def get(self, key):
+        with self._lock:
+            if key in self._frames:
+                # Re-insert to mark as most recently used
+                self._frames[key] = self._frames.pop(key)
+                return self._frames[key]
+        if self.cache_dir and os.path.exists(self._path(key)):
+            entries_df = pd.read_pickle(self._path(key))
+            self._remember(key, entries_df)
+            self._touch(key)
+            return entries_df
+        return None
+
+    def put(self, key, entries_df):
+        self._remember(key, entries_df)
+        if self.cache_dir:
+            tmp_path = self._path(key) + ".tmp"
+            entries_df.to_pickle(tmp_path)
+            os.replace(tmp_path, self._path(key))
+            self._prune_disk()
+
+    def _remember(self, key, entries_df):
+        with self._lock:
+            self._frames.pop(key, None)
+            self._frames[key] = entries_df
+            while len(self._frames) > self.max_items:
+                self._frames.pop(next(iter(self._frames)))
+
+    def _touch(self, key):
+        # Disk recency is the file's mtime, so a pickle read back counts as used
+        try:
+            os.utime(self._path(key))
+        except OSError:
+            pass
+
+    def _prune_disk(self):
+        paths = glob.glob(os.path.join(self.cache_dir, "entries_*.pkl"))
+        if len(paths) <= self.max_disk_items:
+            return
+        by_age = sorted(paths, key=lambda path: os.path.getmtime(path) if os.path.exists(path) else 0)
+        for path in by_age[: len(paths) - self.max_disk_items]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                # Another session pruned it first
+                pass
+
+    def clear(self):
+        with self._lock:
+            self._frames.clear()
+
+
+def load_entries(week_files, positions_file, cache=None, key=None, compact=False, workers=None):
+    """Return the enriched `entries_df`, reusing a cached copy when the inputs are unchanged.
+
+    Pass a precomputed `key` from `content_key` to avoid hashing the files
+    twice. With `compact`, the frame uses the shared categorical layout from
+    `compact_entries`. On a cache miss, weeks are parsed and enriched across
+    `workers` processes.
+    """
+    def build():
+        entries_df = build_entries_parallel(week_files, positions_file, workers=workers)
+        return compact_entries(entries_df) if compact else entries_df
+
+    if cache is None:
+        return build()
+
+    if key is None:
+        key = content_key(week_files, positions_file)
+    if compact:
+        key = f"{key}-compact"
+    entries_df = cache.get(key)
+    if entries_df is None:
+        entries_df = build()
+        cache.put(key, entries_df)
+    return entries_df
@@ -0,0 +1,105 @@
+import hashlib
+import io
+
+import matplotlib.pyplot as plt
+import pandas as pd
+import seaborn as sns
+
+CHART_RENDERERS = ["Matplotlib", "Vega-Lite"]
+
+# Same output `st.pyplot` produces for a figure
+SAVEFIG_OPTIONS = {"bbox_inches": "tight", "dpi": 200, "format": "png"}
+
+
+def table_key(table):
+    """Content hash of a small aggregated table (values, index and columns)."""
+    digest = hashlib.sha256(pd.util.hash_pandas_object(table, index=True).to_numpy().tobytes())
+    digest.update(repr((list(table.columns), table.index.name, table.columns.name)).encode())
+    return digest.hexdigest()
+
+
+def _png(fig):
+    # Rasterize once and release the figure, so cached charts hold bytes rather than live figures
+    try:
+        buffer = io.BytesIO()
+        fig.savefig(buffer, **SAVEFIG_OPTIONS)
+        return buffer.getvalue()
+    finally:
+        plt.close(fig)
+
+
+def heatmap_png(counts, title):
+    """Tab 2: round × position count heatmap as PNG bytes."""
+    fig, ax = plt.subplots(figsize=(8, 4.5))
+    sns.heatmap(counts, annot=True, fmt=".0f", cmap="Blues", ax=ax)
+    ax.set_title(title)
+    return _png(fig)
+
+
+def anchor_flow_png(percentages, title):
+    """Tab 3: stacked position percentages per round as PNG bytes."""
+    fig, ax = plt.subplots(figsize=(8, 4.5))
+    percentages.plot(kind="bar", stacked=True, ax=ax, colormap="tab20")
+    for container in ax.containers:
+        ax.bar_label(container, fmt="%.1f%%", label_type="center", fontsize=8)
+    ax.set_title(title)
+    ax.set_xlabel("Draft Round")
+    ax.set_ylabel("Percentage of Teams")
+    ax.grid(axis="y")
+    return _png(fig)
+
+
+def _values(table, value):
+    long = table.rename_axis(index="Round", columns="Position").stack().rename(value).reset_index()
+    return long.astype({"Round": str, "Position": str}).to_dict("records")
+
+
+def heatmap_spec(counts, title):
+    """Tab 2 heatmap as a Vega-Lite spec with inline data."""
+    return {
+        "title": title,
+        "data": {"values": _values(counts, "Count")},
+        "encoding": {
+            "x": {"field": "Position", "type": "nominal", "axis": {"labelAngle": 0}},
+            "y": {"field": "Round", "type": "ordinal"},
+        },
+        "layer": [
+            {
+                "mark": "rect",
+                "encoding": {"color": {"field": "Count", "type": "quantitative", "scale": {"scheme": "blues"}}},
+            },
+            {
+                "mark": {"type": "text", "baseline": "middle"},
+                "encoding": {"text": {"field": "Count", "type": "quantitative", "format": ".0f"}},
+            },
+        ],
+    }
+
+
+def anchor_flow_spec(percentages, title):
+    """Tab 3 stacked bars as a Vega-Lite spec with inline data, labelled mid-segment."""
+    return {
+        "title": title,
+        "data": {"values": _values(percentages, "Percentage")},
+        "transform": [
+            {"stack": "Percentage", "groupby": ["Round"], "sort": [{"field": "Position"}], "as": ["start", "end"]},
+            {"calculate": "(datum.start + datum.end) / 2", "as": "middle"},
+            {"calculate": "format(datum.Percentage, '.1f') + '%'", "as": "label"},
+        ],
+        "encoding": {"x": {"field": "Round", "type": "ordinal", "title": "Draft Round", "axis": {"labelAngle": 0}}},
+        "layer": [
+            {
+                "mark": "bar",
+                "encoding": {
+                    "y": {"field": "start", "type": "quantitative", "title": "Percentage of Teams"},
+                    "y2": {"field": "end"},
+                    "color": {"field": "Position", "type": "nominal", "scale": {"scheme": "tableau20"}},
+                },
+            },
+            {
+                "mark": {"type": "text", "fontSize": 8},
+                "transform": [{"filter": "datum.Percentage > 0"}],
+                "encoding": {"y": {"field": "middle", "type": "quantitative"}, "text": {"field": "label"}},
+            },
+        ],
+    }
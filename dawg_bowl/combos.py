@@ -0,0 +1,90 @@
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from .layout import PLAYER_COLUMNS, encode_columns
+
+
+class ComboMatrix:
+    """Sparse entry × player incidence matrix for pair co-occurrence counts.
+
+    Players are encoded to integer IDs in sorted name order, so for any pair
+    `(a, b)` with `a < b` the names come out the same way as
+    `sorted(players)` did in the original `combinations` loops. Pair counts
+    for any subset of entries are a single product `Xᵀ·X` over the masked
+    rows, so every week and tier is answered from one structure.
+    """
+
+    def __init__(self, incidence, players):
+        self.incidence = incidence
+        self.players = players
+
+    @classmethod
+    def from_entries(cls, entries_df):
+        codes, players = encode_columns(entries_df, PLAYER_COLUMNS)
+        n_entries = len(entries_df)
+        rows = np.repeat(np.arange(n_entries), len(PLAYER_COLUMNS))
+        incidence = sparse.csr_matrix(
+            (np.ones(codes.size, dtype=np.int32), (rows, codes.ravel())),
+            shape=(n_entries, len(players)),
+        )
+        return cls(incidence, players)
+
+    @property
+    def n_players(self):
+        return len(self.players)
+
+    def _rows(self, mask):
+        if mask is None:
+            return self.incidence
+        return self.incidence[np.flatnonzero(np.asarray(mask))]
+
+    def player_counts(self, mask=None):
+        """Appearances per player ID over the masked entries."""
+        return np.asarray(self._rows(mask).sum(axis=0)).ravel()
+
+    def pair_counts(self, mask=None):
+        """Return `(a, b, count)` arrays for every co-drafted pair with `a < b`."""
+        X = self._rows(mask)
+        co = sparse.triu(X.T @ X, k=1).tocoo()
+        return co.row, co.col, co.data.astype(np.int64)
+
+    def pair_keys(self, a, b):
+        return a.astype(np.int64) * self.n_players + b
+
+    def pair_series(self, mask=None):
+        """Pair counts as a Series keyed by `a * n_players + b`."""
+        a, b, counts = self.pair_counts(mask)
+        return pd.Series(counts, index=self.pair_keys(a, b))
+
+    def combo_table(self, top_mask, base_mask=None, top_label="Top Tier", min_support=1):
+        """Pair counts for a tier against the field it is drawn from.
+
+        `top_mask` selects the elite entries and `base_mask` (default: all
+        entries) the field; elite rows outside the field are ignored. Pairs
+        drafted fewer than `min_support` times are dropped before the table
+        is built.
+        """
+        top_mask = np.asarray(top_mask, dtype=bool)
+        if base_mask is not None:
+            top_mask = top_mask & np.asarray(base_mask, dtype=bool)
+
+        a, b, all_counts = self.pair_counts(base_mask)
+        if min_support > 1:
+            keep = all_counts >= min_support
+            a, b, all_counts = a[keep], b[keep], all_counts[keep]
+        keys = self.pair_keys(a, b)
+        top_counts = self.pair_series(top_mask).reindex(keys, fill_value=0).to_numpy()
+        return combo_frame(self.players[a], self.players[b], top_counts, all_counts, top_label)
+
+
+def combo_frame(players_a, players_b, top_counts, all_counts, top_label="Top Tier"):
+    """Combo table layout shared by every pair-count source, sorted by hit rate."""
+    combo_table = pd.DataFrame({
+        "Player A": players_a,
+        "Player B": players_b,
+        top_label: top_counts,
+        "All Entries": all_counts,
+    })
+    combo_table["Elite Hit Rate (%)"] = (combo_table[top_label] / combo_table["All Entries"]) * 100
+    return combo_table.sort_values("Elite Hit Rate (%)", ascending=False, kind="stable").reset_index(drop=True)
@@ -0,0 +1,210 @@
+import numpy as np
+import pandas as pd
+
+from .layout import PLAYER_COLUMNS, encode_columns
+from .stacks import stack_labels
+from .tiers import FLAG_COLUMNS, TIER_COLUMNS
+
+ALL_WEEKS = "All Weeks"
+ALL_ENTRIES = "All Entries"
+ALL_ROUNDS = "All Rounds"
+TIER_OPTIONS = [ALL_ENTRIES] + list(TIER_COLUMNS)
+
+
+def tier_mask(entries_df, tier):
+    """Boolean mask for a tier label; "All Entries" keeps every row."""
+    if tier == ALL_ENTRIES:
+        return pd.Series(True, index=entries_df.index)
+    return entries_df[TIER_COLUMNS[tier]]
+
+
+def position_counts(entries_df, rounds=range(1, 7)):
+    """Round × position pick counts for the given rounds, as in the Heatmap tab."""
+    counts = pd.concat(
+        [entries_df[f"Pos {i}"].value_counts().loc[lambda c: c > 0].rename(i) for i in rounds],
+        axis=1,
+    ).T.fillna(0)
+    counts.index.name = "Round"
+    counts.columns.name = "Position"
+    return counts.sort_index(axis=1)
+
+
+class PlayerRoundCounts:
+    """Week × round × player × tier-pattern appearance counts.
+
+    Each appearance is counted under the pattern of tier flags its entry
+    holds (bit `i` set for `FLAG_COLUMNS[i]`), so every tier filter and
+    every per-tier count is a sum over patterns. Built with one `bincount`
+    over the encoded player columns.
+    """
+
+    def __init__(self, counts, weeks, players):
+        self.counts = counts
+        self.weeks = weeks
+        self.players = players
+
+    @classmethod
+    def from_entries(cls, entries_df):
+        codes, players = encode_columns(entries_df, PLAYER_COLUMNS)
+        week_codes, weeks = pd.factorize(entries_df["Week"], sort=True)
+        patterns = sum(
+            entries_df[col].to_numpy(dtype=np.int64) << bit for bit, col in enumerate(FLAG_COLUMNS)
+        )
+
+        shape = (len(weeks), len(PLAYER_COLUMNS), len(players), 1 << len(FLAG_COLUMNS))
+        rounds = np.arange(len(PLAYER_COLUMNS))
+        keys = ((week_codes[:, None] * shape[1] + rounds) * shape[2] + codes) * shape[3] + patterns[:, None]
+        # Missing players or weeks have code -1 and are not counted, as in a groupby
+        keys = keys[(codes >= 0) & (week_codes >= 0)[:, None]]
+        counts = np.bincount(keys, minlength=int(np.prod(shape))).reshape(shape)
+        return cls(counts, np.asarray(weeks, dtype=object), players)
+
+    def merge(self, other):
+        """Sum two tensors over the union of their weeks and players."""
+        weeks = np.union1d(self.weeks, other.weeks)
+        players = np.union1d(self.players, other.players)
+        _, n_rounds, _, n_patterns = self.counts.shape
+        counts = np.zeros((len(weeks), n_rounds, len(players), n_patterns), dtype=np.int64)
+        for part in (self, other):
+            counts[np.ix_(
+                np.searchsorted(weeks, part.weeks), np.arange(n_rounds),
+                np.searchsorted(players, part.players), np.arange(n_patterns),
+            )] += part.counts
+        return PlayerRoundCounts(counts, weeks, players)
+
+    def summary(self, week=ALL_WEEKS, tier=ALL_ENTRIES, round_filter=ALL_ROUNDS):
+        """Per-player tier counts and appearances, for players drafted at least once."""
+        counts = self.counts
+        if week != ALL_WEEKS:
+            counts = counts[self.weeks == week]
+        if round_filter != ALL_ROUNDS:
+            counts = counts[:, [PLAYER_COLUMNS.index(round_filter)]]
+        by_pattern = counts.sum(axis=(0, 1))
+
+        patterns = np.arange(by_pattern.shape[1])
+        bits = {col: (patterns >> bit) & 1 == 1 for bit, col in enumerate(FLAG_COLUMNS)}
+        in_tier = np.ones(len(patterns), dtype=bool) if tier == ALL_ENTRIES else bits[TIER_COLUMNS[tier]]
+
+        summary = pd.DataFrame(
+            {col: by_pattern[:, in_tier & bits[col]].sum(axis=1) for col in FLAG_COLUMNS},
+            index=pd.Index(self.players, name="Player"),
+        )
+        summary["Total Appearances"] = by_pattern[:, in_tier].sum(axis=1)
+        return summary[summary["Total Appearances"] > 0]
+
+
+class AggregateCubes:
+    """Per-week aggregates built once per dataset so tab filters become lookups.
+
+    Each cube is indexed by `Week` (and tier where relevant). "All Weeks"
+    views sum the week slices instead of rescanning `entries_df`.
+    """
+
+    def __init__(self, user_tiers, round_positions, anchor_rounds, player_rounds, stacked, stack_types):
+        self.user_tiers = user_tiers
+        self.round_positions = round_positions
+        self.anchor_rounds = anchor_rounds
+        self.player_rounds = player_rounds
+        self.stacked = stacked
+        self.stack_types = stack_types
+
+    @classmethod
+    def from_entries(cls, entries_df, labels=None):
+        if labels is None:
+            labels = stack_labels(entries_df)
+
+        user_tiers = entries_df.groupby(["Week", "username"])[FLAG_COLUMNS].sum().astype(int)
+        user_tiers["Total Entries"] = entries_df.groupby(["Week", "username"]).size()
+
+        round_positions = {}
+        anchor_rounds = {}
+        for tier in TIER_OPTIONS:
+            tier_df = entries_df[tier_mask(entries_df, tier)]
+            for week, week_df in tier_df.groupby("Week"):
+                round_positions[(week, tier)] = position_counts(week_df)
+                for anchor, anchor_df in week_df.groupby("Pos 1"):
+                    anchor_rounds[(week, tier, anchor)] = position_counts(anchor_df, range(2, 7))
+        player_rounds = PlayerRoundCounts.from_entries(entries_df)
+
+        stacked = _elite_counts(entries_df, labels["Stacked"])
+        stack_types = _elite_counts(entries_df, labels["Stack Type"])
+        return cls(user_tiers, round_positions, anchor_rounds, player_rounds, stacked, stack_types)
+
+    def merge(self, other):
+        """Sum two sets of cubes, e.g. built from different chunks of the same weeks."""
+        return AggregateCubes(
+            _add(self.user_tiers, other.user_tiers),
+            _add_dicts(self.round_positions, other.round_positions),
+            _add_dicts(self.anchor_rounds, other.anchor_rounds),
+            self.player_rounds.merge(other.player_rounds),
+            _add(self.stacked, other.stacked),
+            _add(self.stack_types, other.stack_types),
+        )
+
+    @staticmethod
+    def _weeks(cube, week):
+        if week == ALL_WEEKS:
+            return cube
+        return cube.loc[[week]] if week in cube.index.get_level_values("Week") else cube.iloc[:0]
+
+    @staticmethod
+    def _sum_slices(slices):
+        if not slices:
+            return pd.DataFrame()
+        return pd.concat(slices).fillna(0).groupby(level=0).sum()
+
+    def user_summary(self, week=ALL_WEEKS):
+        """Per-user tier counts and entry totals for one week or all weeks."""
+        summary = self._weeks(self.user_tiers, week).groupby(level="username").sum()
+        return summary.reset_index()
+
+    def position_counts(self, week=ALL_WEEKS, tier=ALL_ENTRIES):
+        slices = [c for (w, t), c in self.round_positions.items() if t == tier and (week == ALL_WEEKS or w == week)]
+        counts = self._sum_slices(slices)
+        counts.index.name = "Round"
+        counts.columns.name = "Position"
+        return counts.sort_index(axis=1)
+
+    def anchor_counts(self, anchor, week=ALL_WEEKS, tier=ALL_ENTRIES):
+        slices = [
+            c for (w, t, a), c in self.anchor_rounds.items()
+            if t == tier and a == anchor and (week == ALL_WEEKS or w == week)
+        ]
+        counts = self._sum_slices(slices)
+        counts.index.name = "Round"
+        counts.columns.name = "Position"
+        return counts.sort_index(axis=1)
+
+    def player_summary(self, week=ALL_WEEKS, tier=ALL_ENTRIES, round_filter=ALL_ROUNDS):
+        """Per-player tier counts and appearances, optionally for one draft slot."""
+        return self.player_rounds.summary(week, tier, round_filter)
+
+    def stack_summary(self, week, tier_column):
+        return _elite_summary(self._weeks(self.stacked, week), tier_column)
+
+    def stack_type_summary(self, week, tier_column):
+        return _elite_summary(self._weeks(self.stack_types, week), tier_column)
+
+
+def _add(a, b):
+    total = a.add(b, fill_value=0).fillna(0)
+    return total.astype(int) if all(dtype.kind in "iu" for dtype in a.dtypes) else total
+
+
+def _add_dicts(a, b):
+    merged = dict(a)
+    for key, cube in b.items():
+        merged[key] = _add(merged[key], cube) if key in merged else cube
+    return merged
+
+
+def _elite_counts(entries_df, labels):
+    grouped = entries_df.groupby(["Week", labels])
+    counts = grouped[FLAG_COLUMNS].sum().astype(int)
+    counts["Entry Count"] = grouped.size()
+    return counts
+
+
+def _elite_summary(counts, tier_column):
+    summary = counts.groupby(level=-1)[["Entry Count", tier_column]].sum()
+    return summary.rename(columns={tier_column: "Elite Hits"})
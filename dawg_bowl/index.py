@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+from .layout import PLAYER_COLUMNS, TEAM_COLUMNS, encode_columns
+
+
+def _postings(codes, rows, keys):
+    """Map each key to the sorted, de-duplicated row IDs where its code appears.
+
+    `rows` must be non-decreasing, so a stable sort by code leaves each
+    key's rows in order with any repeats next to each other.
+    """
+    order = np.argsort(codes, kind="stable")
+    codes, rows = codes[order], rows[order]
+    keep = np.ones(len(codes), dtype=bool)
+    keep[1:] = (codes[1:] != codes[:-1]) | (rows[1:] != rows[:-1])
+    codes, rows = codes[keep], rows[keep]
+    bounds = np.searchsorted(codes, np.arange(len(keys) + 1))
+    return {key: rows[bounds[i]:bounds[i + 1]] for i, key in enumerate(keys) if bounds[i + 1] > bounds[i]}
+
+
+class EntryIndex:
+    """Inverted index from username, player, team and week to entry row positions.
+
+    Row IDs are positions in `entries_df` (use `.iloc`). Usernames are keyed
+    lowercase to match the dashboard's case-insensitive filters. Lookups
+    intersect sorted ID arrays instead of comparing strings across the frame.
+    """
+
+    def __init__(self, n_rows, users, players, teams, weeks):
+        self.n_rows = n_rows
+        self.users = users
+        self.players = players
+        self.teams = teams
+        self.weeks = weeks
+
+    @classmethod
+    def from_entries(cls, entries_df):
+        n_rows = len(entries_df)
+        all_rows = np.arange(n_rows)
+
+        user_codes, user_keys = pd.factorize(entries_df["username"].astype(str).str.lower())
+        week_codes, week_keys = pd.factorize(entries_df["Week"].astype(str))
+
+        player_codes, player_keys = encode_columns(entries_df, PLAYER_COLUMNS)
+        team_codes, team_keys = encode_columns(entries_df, TEAM_COLUMNS)
+        slot_rows = np.repeat(all_rows, len(PLAYER_COLUMNS))
+
+        return cls(
+            n_rows,
+            _postings(user_codes, all_rows, user_keys),
+            _postings(player_codes.ravel(), slot_rows, player_keys),
+            _postings(team_codes.ravel(), slot_rows, team_keys),
+            _postings(week_codes, all_rows, week_keys),
+        )
+
+    def rows(self, user=None, players=(), teams=(), week=None):
+        """Sorted row IDs matching every given filter (all rows when none are given).
+
+        `players` and `teams` are combined with AND, so two players returns
+        the entries that drafted both.
+        """
+        postings = []
+        if user:
+            postings.append(self.users.get(user.lower(), np.empty(0, dtype=np.int64)))
+        if week is not None and week != "All Weeks":
+            postings.append(self.weeks.get(week, np.empty(0, dtype=np.int64)))
+        postings += [self.players.get(player, np.empty(0, dtype=np.int64)) for player in players]
+        postings += [self.teams.get(team, np.empty(0, dtype=np.int64)) for team in teams]
+        if not postings:
+            return np.arange(self.n_rows)
+
+        # Intersect shortest lists first to keep intermediate results small
+        postings.sort(key=len)
+        result = postings[0]
+        for other in postings[1:]:
+            result = np.intersect1d(result, other, assume_unique=True)
+        return result
+
+    def mask(self, **filters):
+        """Boolean entry mask for the same filters as `rows`."""
+        mask = np.zeros(self.n_rows, dtype=bool)
+        mask[self.rows(**filters)] = True
+        return mask
@@ -0,0 +1,177 @@
+import io
+import os
+
+import pandas as pd
+
+from .perf import stage
+from .roles import roles_frame
+from .tiers import FLAG_COLUMNS, tag_tiers
+
+
+# 🔹 File helpers
+class NamedBytes:
+    """Picklable stand-in for an uploaded file: a name plus its contents."""
+
+    def __init__(self, name, data):
+        self.name = name
+        self.data = data
+
+    @classmethod
+    def from_file(cls, file):
+        return cls(file_name(file), file_bytes(file))
+
+    def getvalue(self):
+        return self.data
+
+
+def file_name(file):
+    """Return the base name of an uploaded file or a path on disk."""
+    name = getattr(file, "name", file)
+    return os.path.basename(str(name))
+
+
+def file_bytes(file):
+    """Return the raw contents of an uploaded file or a path on disk."""
+    if hasattr(file, "getvalue"):
+        return file.getvalue()
+    with open(file, "rb") as fh:
+        return fh.read()
+
+
+def week_label(file):
+    """Extract the week number from a `*_Week_N_DBQ.csv` file name."""
+    return file_name(file).split("_Week_")[1].split("_")[0]
+
+
+# 🔹 Parsing
+def read_weeks(week_files):
+    return pd.concat([read_week(file) for file in week_files], ignore_index=True)
+
+
+def read_positions(positions_file):
+    with stage("read_positions") as record:
+        position_df = pd.read_excel(io.BytesIO(file_bytes(positions_file)))
+        # Normalize column names to avoid KeyError
+        position_df.columns = position_df.columns.str.strip().str.title()
+        # Free agents are listed with a numeric 0 team; keep every team a string
+        position_df["Team"] = position_df["Team"].astype(str)
+        record["rows"] = len(position_df)
+    return position_df
+
+
+# 🔹 Enrichment
+def map_positions(entries_df, position_df):
+    position_map = dict(zip(position_df["Name"], position_df["Position"]))
+    team_map = dict(zip(position_df["Name"], position_df["Team"]))
+
+    with stage("map_positions", rows=len(entries_df)):
+        for i in range(1, 7):
+            col = f"Player {i}"
+            entries_df[f"Pos {i}"] = entries_df[col].map(position_map).fillna("Unknown")
+            entries_df[f"Team {i}"] = entries_df[col].map(team_map).fillna("Unknown")
+    return entries_df
+
+
+def _assign_roles_row(row):
+    roles = {"QB Pick": None, "RB1 Pick": None, "WR1 Pick": None, "WR2 Pick": None, "TE Pick": None, "Flex Pick": None}
+    rb_count = wr_count = 0
+    used_slots = set()
+    for i in range(1, 7):
+        pos = row[f"Pos {i}"]
+        slot = i
+        if pos == "QB" and not roles["QB Pick"]:
+            roles["QB Pick"] = slot; used_slots.add(slot)
+        elif pos == "RB" and rb_count < 1:
+            roles["RB1 Pick"] = slot; rb_count += 1; used_slots.add(slot)
+        elif pos == "WR" and wr_count < 2:
+            if not roles["WR1 Pick"]: roles["WR1 Pick"] = slot
+            else: roles["WR2 Pick"] = slot
+            wr_count += 1; used_slots.add(slot)
+        elif pos == "TE" and not roles["TE Pick"]:
+            roles["TE Pick"] = slot; used_slots.add(slot)
+    for i in range(1, 7):
+        pos = row[f"Pos {i}"]
+        slot = i
+        if slot not in used_slots and pos in ["RB", "WR", "TE"]:
+            roles["Flex Pick"] = slot
+            break
+    return pd.Series(roles)
+
+
+def assign_roles_rowwise(entries_df):
+    """Reference row-by-row implementation, kept for benchmarks and parity checks."""
+    return pd.concat([entries_df, entries_df.apply(_assign_roles_row, axis=1)], axis=1)
+
+
+def assign_roles(entries_df):
+    with stage("assign_roles", rows=len(entries_df)):
+        return pd.concat([entries_df, roles_frame(entries_df)], axis=1)
+
+
+def tag_week_tiers(df, total, tiers=None):
+    """Flag rows of a single week whose place makes each tier of a `total`-entry field.
+
+    `total` is passed separately so a chunk of a week can be tagged without
+    the rest of it.
+    """
+    return tag_tiers(df, total, tiers)
+
+
+def tag_percentile_tiers(df, tiers=None):
+    """Tag tier flags for every week from one grouped transform of the week sizes."""
+    return tag_tiers(df, df.groupby("Week")["Week"].transform("size").to_numpy(), tiers)
+
+
+def tag_percentile_tiers_groupby(df):
+    """Reference per-week `apply` implementation, kept for benchmarks and parity checks."""
+    def tag_group(group):
+        total = len(group)
+        group["Top_0.1%"] = group["place"].astype(int) <= max(1, round(0.001 * total))
+        group["Top_0.5%"] = group["place"].astype(int) <= max(1, round(0.005 * total))
+        group["Top_1%"] = group["place"].astype(int) <= max(1, round(0.01 * total))
+        return group
+    # Select columns explicitly so the "Week" key survives apply on pandas >= 2.2
+    return df.groupby("Week", group_keys=False)[df.columns.tolist()].apply(tag_group)
+
+
+def enrich_week(df, position_df):
+    """Positions, teams, roles and tier flags for a single week's entries."""
+    df = map_positions(df, position_df)
+    df = assign_roles(df)
+    return tag_week_tiers(df, len(df))
+
+
+def read_week(week_file):
+    with stage("read_csv") as record:
+        df = pd.read_csv(io.BytesIO(file_bytes(week_file)))
+        df["Week"] = f"Week {week_label(week_file)}"
+        record["rows"] = len(df)
+    return df
+
+
+def add_total_entries(entries_df):
+    """Count each user's entries across every loaded week.
+
+    The column goes ahead of the tier flags when they are already present,
+    matching the layout produced by `enrich_entries`.
+    """
+    with stage("total_entries", rows=len(entries_df)):
+        total_entries = entries_df.groupby("username")["username"].transform("count")
+    if FLAG_COLUMNS[0] in entries_df:
+        entries_df.insert(entries_df.columns.get_loc(FLAG_COLUMNS[0]), "Total Entries", total_entries)
+    else:
+        entries_df["Total Entries"] = total_entries
+    return entries_df
+
+
+def enrich_entries(entries_df, position_df):
+    """Add positions, teams, roles, entry counts and tier flags to raw entries."""
+    entries_df = map_positions(entries_df, position_df)
+    entries_df = assign_roles(entries_df)
+    entries_df = add_total_entries(entries_df)
+    return tag_percentile_tiers(entries_df)
+
+
+def build_entries(week_files, positions_file):
+    """Parse and enrich weekly contest files without any caching."""
+    return enrich_entries(read_weeks(week_files), read_positions(positions_file))
@@ -0,0 +1,130 @@
+from itertools import combinations
+
+import numpy as np
+import pandas as pd
+
+from .layout import PLAYER_COLUMNS, POS_COLUMNS, TEAM_COLUMNS, encode_columns
+from .tiers import TIER_COLUMNS
+
+MAX_COMBO_SIZE = 4
+# Largest key space answered with a dense boolean table instead of a sorted lookup
+DENSE_LOOKUP_LIMIT = 1 << 24
+COMBO_LABELS = [f"Player {chr(ord('A') + i)}" for i in range(MAX_COMBO_SIZE)]
+
+
+def _first_seen(entries_df, columns, codes, size):
+    """Value of `columns` observed alongside each player code (first occurrence wins).
+
+    Every player is "Unknown" when the columns are absent, e.g. raw weekly CSVs.
+    """
+    result = np.full(size, "Unknown", dtype=object)
+    if columns[0] in entries_df:
+        result[codes[::-1]] = entries_df[columns].to_numpy(dtype=object).ravel()[::-1]
+    return result
+
+
+def _contains(sorted_keys, keys, key_space):
+    """`np.isin` for a sorted, unique array of keys drawn from `range(key_space)`."""
+    if len(sorted_keys) == 0:
+        return np.zeros(keys.shape, dtype=bool)
+    if key_space <= DENSE_LOOKUP_LIMIT:
+        table = np.zeros(key_space, dtype=bool)
+        table[sorted_keys] = True
+        return table[keys]
+    positions = np.minimum(np.searchsorted(sorted_keys, keys), len(sorted_keys) - 1)
+    return sorted_keys[positions] == keys
+
+
+class ComboMiner:
+    """Frequent 2–4 player combos over integer-coded lineups, Apriori style.
+
+    Each lineup is stored as its six player IDs in ascending order, so every
+    k-subset of slots is already a sorted combo and can be packed into one
+    int64 key. Level k only counts candidates whose (k-1)-subsets all met the
+    minimum support at level k-1, which keeps triples and quads cheap.
+    """
+
+    def __init__(self, lineups, players, positions, teams):
+        self.lineups = lineups
+        self.players = players
+        self.positions = positions
+        self.teams = teams
+
+    @classmethod
+    def from_entries(cls, entries_df):
+        codes, players = encode_columns(entries_df, PLAYER_COLUMNS)
+        positions = _first_seen(entries_df, POS_COLUMNS, codes.ravel(), len(players))
+        teams = _first_seen(entries_df, TEAM_COLUMNS, codes.ravel(), len(players))
+        return cls(np.sort(codes, axis=1), players, positions, teams)
+
+    def _keys(self, combos):
+        keys = np.zeros(combos.shape[:-1], dtype=np.int64)
+        for i in range(combos.shape[-1]):
+            keys = keys * len(self.players) + combos[..., i]
+        return keys
+
+    def _decode(self, keys, size):
+        combos = np.empty((len(keys), size), dtype=np.int64)
+        for i in reversed(range(size)):
+            keys, combos[:, i] = np.divmod(keys, len(self.players))
+        return combos
+
+    def frequent(self, size, min_support=1, mask=None):
+        """Combos of `size` players drafted together in at least `min_support` masked entries.
+
+        Returns `(combos, entries, inverse)`: one row of sorted player IDs per
+        combo, and for every occurrence its entry row and combo index.
+        """
+        if not 1 <= size <= MAX_COMBO_SIZE:
+            raise ValueError(f"Combo size must be between 1 and {MAX_COMBO_SIZE}")
+        rows = np.arange(len(self.lineups)) if mask is None else np.flatnonzero(np.asarray(mask, dtype=bool))
+        lineups = self.lineups[rows]
+
+        frequent_keys = None
+        for k in range(1, size + 1):
+            slots = np.array(list(combinations(range(len(PLAYER_COLUMNS)), k)))
+            candidates = lineups[:, slots]
+            # Skip repeated players and any combo with an infrequent (k-1)-subset
+            valid = (np.diff(candidates, axis=2) > 0).all(axis=2)
+            if frequent_keys is not None:
+                for drop in range(k):
+                    subsets = self._keys(np.delete(candidates, drop, axis=2))
+                    valid &= _contains(frequent_keys, subsets, len(self.players) ** (k - 1))
+
+            # Entries with no surviving candidate cannot extend to the next level
+            live = valid.any(axis=1)
+            rows, lineups, candidates, valid = rows[live], lineups[live], candidates[live], valid[live]
+            entry, slot = np.nonzero(valid)
+            keys, inverse, counts = np.unique(self._keys(candidates[entry, slot]), return_inverse=True, return_counts=True)
+            keep = counts >= min_support
+            frequent_keys = keys[keep]
+
+        occurs = keep[inverse]
+        remap = np.cumsum(keep) - 1
+        return self._decode(frequent_keys, size), rows[entry[occurs]], remap[inverse[occurs]]
+
+    def combo_table(self, size, tier_masks, min_support=1, base_mask=None):
+        """Combo counts for each tier against the field, sorted by the first tier's hit rate.
+
+        `tier_masks` maps output column names (e.g. `"Top 1%"`) to entry
+        masks; `base_mask` (default: all entries) selects the field.
+        """
+        combos, entries, inverse = self.frequent(size, min_support, base_mask)
+        teams = self.teams[combos]
+
+        table = pd.DataFrame({label: self.players[combos[:, i]] for i, label in enumerate(COMBO_LABELS[:size])})
+        table["Positions"] = ["/".join(positions) for positions in np.sort(self.positions[combos].astype(str), axis=1)]
+        table["Same Team"] = (teams == teams[:, :1]).all(axis=1) & (teams[:, 0] != "Unknown")
+        table["All Entries"] = np.bincount(inverse, minlength=len(combos))
+        for label, mask in tier_masks.items():
+            weights = np.asarray(mask, dtype=bool)[entries]
+            table[label] = np.bincount(inverse, weights=weights, minlength=len(combos)).astype(int)
+        rate_cols = [f"{label} Hit Rate (%)" for label in tier_masks]
+        for label, rate_col in zip(tier_masks, rate_cols):
+            table[rate_col] = table[label] / table["All Entries"] * 100
+        return table.sort_values(rate_cols[:1] + ["All Entries"], ascending=False, kind="stable").reset_index(drop=True)
+
+
+def tier_label_masks(entries_df):
+    """Tier masks keyed by tier label (e.g. `"Top 1%"`), in `TIERS` order."""
+    return {label: entries_df[column].to_numpy() for label, column in TIER_COLUMNS.items()}
@@ -0,0 +1,72 @@
+import numpy as np
+import pandas as pd
+
+from .perf import stage
+from .roles import ROLE_COLUMNS
+
+PLAYER_COLUMNS = [f"Player {i}" for i in range(1, 7)]
+POS_COLUMNS = [f"Pos {i}" for i in range(1, 7)]
+TEAM_COLUMNS = [f"Team {i}" for i in range(1, 7)]
+
+
+def shared_dtype(entries_df, columns):
+    """One sorted categorical dtype covering every value in `columns`."""
+    values = pd.unique(np.concatenate([entries_df[col].to_numpy(dtype=object) for col in columns]))
+    return pd.CategoricalDtype(pd.Index(values).dropna().sort_values())
+
+
+def encode_columns(entries_df, columns):
+    """Integer codes (entries × len(columns)) over one sorted dictionary.
+
+    Uses the shared categorical codes directly when the columns already have
+    the compact layout, otherwise factorizes the values.
+    """
+    dtype = entries_df[columns[0]].dtype
+    if (
+        isinstance(dtype, pd.CategoricalDtype)
+        and dtype.categories.is_monotonic_increasing
+        and all(entries_df[col].dtype == dtype for col in columns)
+    ):
+        codes = np.column_stack([entries_df[col].cat.codes.to_numpy() for col in columns])
+        return codes.astype(np.int64), np.asarray(dtype.categories, dtype=object)
+    codes, values = pd.factorize(entries_df[columns].to_numpy().ravel(), sort=True)
+    return codes.reshape(len(entries_df), len(columns)), np.asarray(values, dtype=object)
+
+
+def compact_entries(entries_df):
+    """Return `entries_df` with a compact, shared-dictionary column layout.
+
+    The six player, position and team columns each share one sorted
+    categorical dtype, so the same name has the same integer code in every
+    slot. `username` and `Week` become categoricals and role slots become
+    int8 (nullable `Int8` if any role is missing). The input frame is left
+    untouched.
+    """
+    with stage("compact_entries", rows=len(entries_df)):
+        compact = entries_df.copy(deep=False)
+        for columns in (PLAYER_COLUMNS, POS_COLUMNS, TEAM_COLUMNS):
+            dtype = shared_dtype(entries_df, columns)
+            for col in columns:
+                compact[col] = entries_df[col].astype(dtype)
+
+        for col in ["username", "Week"]:
+            compact[col] = entries_df[col].astype("category")
+
+        roles = entries_df[ROLE_COLUMNS]
+        compact[ROLE_COLUMNS] = roles.astype("Int8" if roles.isna().any().any() else "int8")
+
+        for col in ["place", "Total Entries"]:
+            if col in compact:
+                compact[col] = pd.to_numeric(entries_df[col], downcast="integer")
+    return compact
+
+
+def memory_report(before, after):
+    """Deep per-column memory usage (bytes) of two layouts of the same frame."""
+    report = pd.DataFrame({
+        "Before": before.memory_usage(deep=True, index=False),
+        "After": after.memory_usage(deep=True, index=False),
+    })
+    report.loc["Total"] = report.sum()
+    report["Saved (%)"] = (1 - report["After"] / report["Before"]) * 100
+    return report
@@ -0,0 +1,91 @@
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+import pandas as pd
+
+from .ingest import NamedBytes, add_total_entries, enrich_week, read_positions, read_week
+from .perf import stage
+
+
+_pool = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
+
+
+def default_workers():
+    """Worker processes to use when none are requested (`DAWG_BOWL_WORKERS`, else 1), at least 1."""
+    try:
+        workers = int(os.environ.get("DAWG_BOWL_WORKERS", 1))
+    except ValueError:
+        workers = 1
+    return max(1, workers)
+
+
+def _executor(workers):
+    # One pool per process, kept between calls so workers are spawned (and import
+    # pandas) once; it is only replaced when the requested size changes
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("spawn"))
+            _pool_workers = workers
+        return _pool
+
+
+def _discard(pool):
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+
+
+def map_weeks(fn, week_files, *args, workers=None):
+    """Apply `fn(week_file, *args)` to every week, fanning out over a process pool.
+
+    Paths on disk are passed through so each worker reads its own file;
+    only uploaded files are converted to picklable `NamedBytes`. Workers
+    are spawned rather than forked, since the Streamlit server is
+    multi-threaded, and the pool is reused by later calls. Results come
+    back in input order. With one worker (or one week) everything runs
+    in-process.
+    """
+    workers = default_workers() if workers is None else workers
+    if workers <= 1 or len(week_files) <= 1:
+        return [fn(week_file, *args) for week_file in week_files]
+
+    week_files = [
+        week_file if isinstance(week_file, (str, os.PathLike)) else NamedBytes.from_file(week_file)
+        for week_file in week_files
+    ]
+    pool = _executor(workers)
+    try:
+        return list(pool.map(fn, week_files, *[[arg] * len(week_files) for arg in args]))
+    except BrokenProcessPool:
+        # A worker died; start a fresh pool next time instead of failing forever
+        _discard(pool)
+        raise
+
+
+def _load_week(week_file, position_df):
+    return enrich_week(read_week(week_file), position_df)
+
+
+def build_entries_parallel(week_files, positions_file, workers=None):
+    """Parse and enrich each week in its own process, then merge.
+
+    Weeks are independent up to `Total Entries`, which spans weeks and is
+    added after the merge.
+    """
+    with stage("build_entries") as record:
+        position_df = read_positions(positions_file)
+        # Stages inside worker processes are not recorded; this one covers them all
+        with stage("load_weeks"):
+            weeks = map_weeks(_load_week, list(week_files), position_df, workers=workers)
+        entries_df = add_total_entries(pd.concat(weeks, ignore_index=True))
+        record["rows"] = len(entries_df)
+    return entries_df
@@ -0,0 +1,128 @@
+import contextvars
+import datetime
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+import pandas as pd
+
+_active = contextvars.ContextVar("dawg_bowl_recorder", default=None)
+
+# tracemalloc is process-wide and every recorder resets its peak between stages, so two
+# tracers would corrupt each other's peaks: only one recorder traces memory at a time,
+# and none does if some other caller already started tracemalloc
+_tracing_lock = threading.Lock()
+_tracing_owner = None
+
+
+def _acquire_tracing(recorder):
+    global _tracing_owner
+    with _tracing_lock:
+        if _tracing_owner is not None or tracemalloc.is_tracing():
+            return False
+        tracemalloc.start()
+        _tracing_owner = recorder
+        return True
+
+
+def _release_tracing(recorder):
+    global _tracing_owner
+    with _tracing_lock:
+        if _tracing_owner is recorder:
+            tracemalloc.stop()
+            _tracing_owner = None
+
+
+class PerfRecorder:
+    """Wall time, rows processed and peak memory for each pipeline stage.
+
+    Stages nest, and each record keeps its depth so a report can indent
+    sub-stages under their parent. Peak memory comes from `tracemalloc`,
+    which slows allocation-heavy code noticeably, so it is only measured
+    with `trace_memory`. It covers Python and NumPy allocations, not Arrow
+    buffers. Only one recorder in the process can trace at a time; while
+    another one is, `memory_refused` is set and peaks are left empty rather
+    than reported wrong. A tracing recorder holds tracemalloc until
+    `close()`, which must always be called (e.g. in a `finally`).
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory and _acquire_tracing(self)
+        self.memory_refused = trace_memory and not self.trace_memory
+        self.records = []
+        self._open = []
+
+    def _fold_peak(self):
+        # Credit the peak so far to every open stage before resetting it for a new one
+        peak = tracemalloc.get_traced_memory()[1]
+        for record in self._open:
+            record["_peak"] = max(record["_peak"], peak)
+        tracemalloc.reset_peak()
+
+    @contextmanager
+    def stage(self, name, rows=None):
+        """Time the enclosed block; set `record["rows"]` inside it if the count is only known later."""
+        record = {"stage": name, "depth": len(self._open), "rows": rows, "seconds": None, "peak_mb": None}
+        self.records.append(record)
+        if self.trace_memory:
+            self._fold_peak()
+            record["_start"] = record["_peak"] = tracemalloc.get_traced_memory()[0]
+        self._open.append(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record["seconds"] = time.perf_counter() - start
+            if self.trace_memory:
+                self._fold_peak()
+                record["peak_mb"] = (record.pop("_peak") - record.pop("_start")) / 2**20
+            self._open.pop()
+
+    def close(self):
+        """Stop memory tracing if this recorder started it."""
+        _release_tracing(self)
+
+    def frame(self):
+        """Records as a table, with sub-stages indented under their parent."""
+        df = pd.DataFrame(self.records, columns=["stage", "depth", "rows", "seconds", "peak_mb"])
+        df["stage"] = ["· " * depth + name for name, depth in zip(df["stage"], df["depth"])]
+        return df.drop(columns="depth").rename(columns={
+            "stage": "Stage", "rows": "Rows", "seconds": "Seconds", "peak_mb": "Peak MB",
+        })
+
+    def total_seconds(self):
+        return sum(record["seconds"] or 0 for record in self.records if record["depth"] == 0)
+
+    def write_log(self, path, **context):
+        """Append one JSON line per record to `path`, tagged with a timestamp and `context`."""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        timestamp = datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds")
+        with open(path, "a") as fh:
+            for record in self.records:
+                fh.write(json.dumps({"time": timestamp, **context, **record}) + "\n")
+
+
+def set_recorder(recorder):
+    """Make `recorder` (or None to disable) the target of `stage` in this thread/context."""
+    _active.set(recorder)
+    return recorder
+
+
+def get_recorder():
+    return _active.get()
+
+
+@contextmanager
+def stage(name, rows=None):
+    """Record a stage on the active recorder; a no-op when none is set."""
+    recorder = _active.get()
+    if recorder is None:
+        yield {}
+        return
+    with recorder.stage(name, rows) as record:
+        yield record
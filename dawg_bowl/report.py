@@ -0,0 +1,324 @@
+import argparse
+import glob
+import os
+
+import pandas as pd
+
+from .cache import load_entries
+from .combos import ComboMatrix
+from .cubes import ALL_ROUNDS, ALL_WEEKS, TIER_OPTIONS, AggregateCubes, position_counts, tier_mask
+from .index import EntryIndex
+from .itemsets import ComboMiner, tier_label_masks
+from .layout import PLAYER_COLUMNS
+from .scanner import scan_entries
+from .stacks import StackEngine, elite_masks
+from .streaming import DEFAULT_CHUNKSIZE, stream_aggregates
+from .tiers import FLAG_COLUMNS, TIER_COLUMNS, TIER_LABELS
+from .trends import TREND_KINDS, TrendEngine
+
+ANCHOR_POSITIONS = ["RB", "WR", "QB", "TE"]
+ROUND_OPTIONS = [ALL_ROUNDS] + PLAYER_COLUMNS
+RATE_COLUMNS = [f"{TIER_LABELS[col]} Rate" for col in FLAG_COLUMNS]
+REPORT_FORMATS = ["parquet", "csv"]
+
+
+# 🔹 Dashboard views
+def add_rates(summary, total_column):
+    """Add a `<tier> Rate` column per tier flag, relative to `total_column`."""
+    for col, rate_col in zip(FLAG_COLUMNS, RATE_COLUMNS):
+        summary[rate_col] = summary[col] / summary[total_column]
+    return summary
+
+
+def user_table(cubes, week=ALL_WEEKS):
+    """Tab 1: per-user tier counts and rates."""
+    return add_rates(cubes.user_summary(week), "Total Entries")
+
+
+def heatmap_counts(cubes, week=ALL_WEEKS, tier="All Entries", user=None, entries_df=None, entry_index=None):
+    """Tab 2: round × position pick counts; a username filter counts that user's rows from the index."""
+    if not user:
+        return cubes.position_counts(week, tier)
+    mask = tier_mask(entries_df, tier) & entry_index.mask(user=user, week=week)
+    return position_counts(entries_df[mask])
+
+
+def anchor_counts(cubes, anchor, week=ALL_WEEKS, tier="All Entries", user=None, entries_df=None, entry_index=None):
+    """Tab 3: rounds 2-6 position counts after a Round 1 `anchor` pick."""
+    if not user:
+        return cubes.anchor_counts(anchor, week, tier)
+    mask = (
+        tier_mask(entries_df, tier)
+        & entry_index.mask(user=user, week=week)
+        & (entries_df["Pos 1"] == anchor)
+    )
+    return position_counts(entries_df[mask], range(2, 7))
+
+
+def anchor_flow(round_counts):
+    """Tab 3: round × position counts as percentages of each round."""
+    return round_counts.div(round_counts.sum(axis=1), axis=0) * 100
+
+
+def player_rate_table(cubes, week=ALL_WEEKS, tier="All Entries", round_filter=ALL_ROUNDS):
+    """Tab 5: per-player tier counts and rates, best Top 1% rate first."""
+    summary = add_rates(cubes.player_summary(week, tier, round_filter), "Total Appearances")
+    return summary.sort_values("Top 1% Rate", ascending=False)
+
+
+def stack_table(cubes, week, tier):
+    """Tab 6: stacked vs unstacked entries and their elite hit rate."""
+    summary = cubes.stack_summary(week, TIER_COLUMNS[tier])
+    summary["Elite Hit Rate (%)"] = (summary["Elite Hits"] / summary["Entry Count"]) * 100
+    return summary.reset_index().replace({True: "Stacked", False: "Unstacked"})
+
+
+def stack_type_table(cubes, week, tier):
+    """Tab 7: QB stacks vs mini stacks vs unstacked entries."""
+    summary = cubes.stack_type_summary(week, TIER_COLUMNS[tier])
+    summary["Elite Hit Rate (%)"] = (summary["Elite Hits"] / summary["Entry Count"]) * 100
+    summary["Stack Prevalence (%)"] = (summary["Entry Count"] / summary["Entry Count"].sum()) * 100
+    return summary.reset_index()
+
+
+def stack_pair_table(stack_engine, tier_masks, base_mask=None, min_support=1):
+    """Tab 7: same-team player pairs with counts and rates per tier."""
+    summary = stack_engine.pair_table(tier_masks, base_mask=base_mask, min_support=min_support)
+    return add_stack_pair_rates(summary, list(tier_masks))
+
+
+def add_stack_pair_rates(summary, elite_cols):
+    """Add a `<tier> Rate` column per elite count column and sort by the Top 1% rate."""
+    rate_cols = [f"{label} Rate" for label in TIER_COLUMNS]
+    for elite_col, rate_col in zip(elite_cols, rate_cols):
+        summary[rate_col] = summary[elite_col] / summary["Total Entries"]
+    summary = summary[["Player A", "Player B", "Combo Type", "Total Entries"] + elite_cols + rate_cols]
+    return summary.sort_values("Top 1% Rate", ascending=False)
+
+
+def _long(frames, names):
+    """Concatenate per-filter tables, with the filter values as leading columns."""
+    parts = {key: frame.reset_index(drop=frame.index.name is None) for key, frame in frames.items()}
+    return pd.concat(parts, names=names).reset_index(level=names).reset_index(drop=True)
+
+
+# 🔹 Batch report
+class _CubeReport:
+    """Tables answered from `AggregateCubes` alone, shared by both report kinds.
+
+    Subclasses set `cubes` and `weeks` and define `tables()`.
+    """
+
+    def user_summary(self):
+        return _long({week: user_table(self.cubes, week) for week in self.weeks}, ["Week"])
+
+    def heatmap(self):
+        return _long({
+            (week, tier): self.cubes.position_counts(week, tier)
+            for week in self.weeks for tier in TIER_OPTIONS
+        }, ["Week", "Tier"])
+
+    def anchor_flow(self):
+        return _long({
+            (week, tier, anchor): anchor_flow(self.cubes.anchor_counts(anchor, week, tier))
+            for week in self.weeks for tier in TIER_OPTIONS for anchor in ANCHOR_POSITIONS
+        }, ["Week", "Tier", "Anchor"])
+
+    def player_rates(self):
+        return _long({
+            (week, tier, round_filter): player_rate_table(self.cubes, week, tier, round_filter)
+            for week in self.weeks for tier in TIER_OPTIONS for round_filter in ROUND_OPTIONS
+        }, ["Week", "Tier", "Round"])
+
+    def stacking(self):
+        return _long({
+            (week, tier): stack_table(self.cubes, week, tier)
+            for week in self.weeks for tier in TIER_COLUMNS
+        }, ["Week", "Tier"])
+
+    def stack_types(self):
+        return _long({
+            (week, tier): stack_type_table(self.cubes, week, tier)
+            for week in self.weeks for tier in TIER_COLUMNS
+        }, ["Week", "Tier"])
+
+    def write(self, out_dir, fmt="parquet"):
+        """Write every table to `out_dir` as `<name>.parquet` or `<name>.csv`; return the paths."""
+        if fmt not in REPORT_FORMATS:
+            raise ValueError(f"Unknown report format {fmt!r}, expected one of {REPORT_FORMATS}")
+        os.makedirs(out_dir, exist_ok=True)
+        paths = []
+        for name, table in self.tables().items():
+            path = os.path.join(out_dir, f"{name}.{fmt}")
+            if fmt == "parquet":
+                table.to_parquet(path, index=False)
+            else:
+                table.to_csv(path, index=False)
+            paths.append(path)
+        return paths
+
+
+class DashboardReport(_CubeReport):
+    """Every dashboard table for one season, computed without Streamlit.
+
+    The dataset is loaded once and the shared structures (aggregate cubes,
+    combo matrix, stack engine, combo miner, trend engine) are built once; each table then
+    covers every filter value the dashboard offers, with those values as
+    leading columns (`Week`, `Tier`, ...).
+    """
+
+    def __init__(self, entries_df, min_support=10):
+        self.entries_df = entries_df
+        self.min_support = min_support
+        self.index = EntryIndex.from_entries(entries_df)
+        self.combo_matrix = ComboMatrix.from_entries(entries_df)
+        self.stack_engine = StackEngine.from_entries(entries_df)
+        self.cubes = AggregateCubes.from_entries(entries_df, labels=self.stack_engine.labels)
+        self.miner = ComboMiner.from_entries(entries_df)
+        self.trend_engine = TrendEngine().update(entries_df)
+        self.weeks = [ALL_WEEKS] + sorted(entries_df["Week"].unique())
+
+    @classmethod
+    def from_files(cls, week_files, positions_file, workers=None, min_support=10):
+        return cls(load_entries(week_files, positions_file, workers=workers), min_support)
+
+    def _week_mask(self, week):
+        return None if week == ALL_WEEKS else self.index.mask(week=week)
+
+    def combos(self):
+        return _long({
+            (week, tier): self.combo_matrix.combo_table(
+                self.entries_df[TIER_COLUMNS[tier]].to_numpy(), base_mask=self._week_mask(week)
+            )
+            for week in self.weeks for tier in TIER_COLUMNS
+        }, ["Week", "Tier"])
+
+    def combos_of(self, size):
+        tier_masks = tier_label_masks(self.entries_df)
+        return _long({
+            week: self.miner.combo_table(size, tier_masks, self.min_support, base_mask=self._week_mask(week))
+            for week in self.weeks
+        }, ["Week"])
+
+    def stack_pairs(self):
+        tier_masks = elite_masks(self.entries_df)
+        return _long({
+            week: stack_pair_table(self.stack_engine, tier_masks, self._week_mask(week))
+            for week in self.weeks
+        }, ["Week"])
+
+    def trends(self, kind):
+        """Rolling elite rates per week for players, combos or users; combos use `min_support`."""
+        min_entries = self.min_support if kind == "combos" else 1
+        return _long({
+            tier: self.trend_engine.trend_table(kind, tier, min_entries)
+            for tier in TIER_COLUMNS
+        }, ["Tier"])
+
+    def trait_scans(self):
+        """Trait scanner output for every week, keyed by `traits` / `combos` / `triples`."""
+        scans = {}
+        for week in self.weeks[1:]:
+            week_df = self.entries_df[(self.entries_df["Week"] == week).to_numpy()].reset_index(drop=True)
+            scans[week] = scan_entries(week_df, week, week.removeprefix("Week "))
+        return {
+            part: _long({week: scan[part] for week, scan in scans.items()}, ["Week"])
+            for part in ["traits", "combos", "triples"]
+        }
+
+    def tables(self):
+        """Every report table, keyed by output file name."""
+        scans = self.trait_scans()
+        return {
+            "user_summary": self.user_summary(),
+            "heatmap": self.heatmap(),
+            "anchor_flow": self.anchor_flow(),
+            "player_combos": self.combos(),
+            "player_combos_3": self.combos_of(3),
+            "player_combos_4": self.combos_of(4),
+            "player_elite_rates": self.player_rates(),
+            "stacking": self.stacking(),
+            "stack_types": self.stack_types(),
+            "stack_pairs": self.stack_pairs(),
+            **{f"trends_{kind}": self.trends(kind) for kind in TREND_KINDS},
+            "scanner_traits": scans["traits"],
+            "scanner_combos": scans["combos"],
+            "scanner_triples": scans["triples"],
+        }
+
+
+class StreamingReport(_CubeReport):
+    """The cube-backed dashboard tables, built by `stream_aggregates` chunk by chunk.
+
+    Peak memory is bounded by the chunk size rather than the season, for
+    fields too large to load whole. Tables that need the entries themselves
+    (3- and 4-player combos, trends, trait scans) are not produced.
+    """
+
+    def __init__(self, aggregates):
+        self.aggregates = aggregates
+        self.cubes = aggregates.cubes
+        self.weeks = [ALL_WEEKS] + sorted(aggregates.entries)
+
+    @classmethod
+    def from_files(cls, week_files, positions_file, chunksize=DEFAULT_CHUNKSIZE, workers=None):
+        return cls(stream_aggregates(week_files, positions_file, chunksize=chunksize, workers=workers))
+
+    def combos(self):
+        return _long({
+            (week, tier): self.aggregates.combo_table(tier, week)
+            for week in self.weeks for tier in TIER_COLUMNS
+        }, ["Week", "Tier"])
+
+    def stack_pairs(self):
+        frames = {}
+        for week in self.weeks:
+            summary = self.aggregates.stack_pair_table(week)
+            frames[week] = add_stack_pair_rates(summary, list(summary.columns[4:]))
+        return _long(frames, ["Week"])
+
+    def tables(self):
+        """The report tables this path can produce, keyed by output file name."""
+        return {
+            "user_summary": self.user_summary(),
+            "heatmap": self.heatmap(),
+            "anchor_flow": self.anchor_flow(),
+            "player_combos": self.combos(),
+            "player_elite_rates": self.player_rates(),
+            "stacking": self.stacking(),
+            "stack_types": self.stack_types(),
+            "stack_pairs": self.stack_pairs(),
+        }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write every Dawg Bowl dashboard table from a directory of weekly DBQ CSVs.")
+    parser.add_argument("data_dir", help="Directory containing *_Week_N_DBQ.csv files")
+    parser.add_argument("out_dir", help="Directory to write report tables into")
+    parser.add_argument("--positions", help="Position List Excel file (default: <data_dir>/Position List.xlsx)")
+    parser.add_argument("--format", choices=REPORT_FORMATS, default="parquet")
+    parser.add_argument("--workers", type=int, help="Worker processes for loading weeks")
+    parser.add_argument("--min-support", type=int, default=10, help="Minimum drafts for 3- and 4-player combos")
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help="Stream weeks in chunks and write only the cube-backed tables (bounded memory for large fields)",
+    )
+    parser.add_argument("--chunksize", type=int, default=DEFAULT_CHUNKSIZE, help="Rows per chunk with --stream")
+    args = parser.parse_args(argv)
+
+    week_files = sorted(glob.glob(os.path.join(args.data_dir, "*_Week_*_DBQ.csv")))
+    if not week_files:
+        parser.error(f"No *_Week_N_DBQ.csv files found in {args.data_dir}")
+    positions = args.positions or os.path.join(args.data_dir, "Position List.xlsx")
+
+    if args.stream:
+        report = StreamingReport.from_files(week_files, positions, chunksize=args.chunksize, workers=args.workers)
+    else:
+        report = DashboardReport.from_files(week_files, positions, workers=args.workers, min_support=args.min_support)
+    for path in report.write(args.out_dir, args.format):
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
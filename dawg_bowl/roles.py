@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+ROLE_COLUMNS = ["QB Pick", "RB1 Pick", "WR1 Pick", "WR2 Pick", "TE Pick", "Flex Pick"]
+POS_COLUMNS = [f"Pos {i}" for i in range(1, 7)]
+
+
+def _nth_slot(mask, n):
+    """1-based slot of the n-th True in each row of `mask`, NaN where there is none."""
+    hit = mask & (np.cumsum(mask, axis=1) == n)
+    return np.where(hit.any(axis=1), hit.argmax(axis=1) + 1, np.nan)
+
+
+def compute_roles(pos_values):
+    """Column-wise role assignment over an (entries × 6) array of positions.
+
+    Mirrors the row-wise rules: the first QB, the first RB, the first two WRs
+    and the first TE are locked in, and Flex is the earliest remaining
+    RB/WR/TE slot.
+    """
+    pos_values = np.asarray(pos_values, dtype=object)
+    is_qb = pos_values == "QB"
+    is_rb = pos_values == "RB"
+    is_wr = pos_values == "WR"
+    is_te = pos_values == "TE"
+
+    used = (
+        (is_qb & (np.cumsum(is_qb, axis=1) == 1))
+        | (is_rb & (np.cumsum(is_rb, axis=1) == 1))
+        | (is_wr & (np.cumsum(is_wr, axis=1) <= 2))
+        | (is_te & (np.cumsum(is_te, axis=1) == 1))
+    )
+    flex = (is_rb | is_wr | is_te) & ~used
+
+    return np.column_stack([
+        _nth_slot(is_qb, 1),
+        _nth_slot(is_rb, 1),
+        _nth_slot(is_wr, 1),
+        _nth_slot(is_wr, 2),
+        _nth_slot(is_te, 1),
+        _nth_slot(flex, 1),
+    ])
+
+
+def roles_frame(entries_df):
+    """Role columns for `entries_df`, typed like the row-wise `apply` output.
+
+    Slots are int64 when every entry fills every role; otherwise the whole
+    block is float64 with NaN for missing roles.
+    """
+    roles = compute_roles(entries_df[POS_COLUMNS].to_numpy())
+    if not np.isnan(roles).any():
+        roles = roles.astype(np.int64)
+    return pd.DataFrame(roles, index=entries_df.index, columns=ROLE_COLUMNS)
@@ -0,0 +1,86 @@
+import io
+
+import pandas as pd
+
+from .cache import content_key
+from .combos import ComboMatrix
+from .itemsets import ComboMiner
+from .ingest import file_bytes, file_name, week_label
+from .parallel import map_weeks
+from .perf import stage
+
+
+# Minimum drafts for a 3-player combo to be reported by the scanner
+TRIPLE_MIN_SUPPORT = 10
+
+
+def scan_week(week_file):
+    """Top 1% player and combo traits for one weekly CSV.
+
+    Returns a dict with `week`, `total_entries`, `top_cutoff`, `traits`,
+    `combos` and `triples`, or with `error` set when the file cannot be read.
+    """
+    try:
+        df = pd.read_csv(io.BytesIO(file_bytes(week_file)))
+        week = week_label(week_file)
+    except Exception as e:
+        return {"name": file_name(week_file), "error": str(e)}
+    return scan_entries(df, file_name(week_file), week)
+
+
+def scan_entries(df, name, week):
+    """`scan_week` for one week's entries that are already loaded."""
+    total_entries = len(df)
+    top_cutoff = max(1, int(total_entries * 0.01))
+    top_df = df.nsmallest(top_cutoff, "place")
+
+    all_players = pd.melt(df, id_vars=["place"], value_vars=[f"Player {i}" for i in range(1, 7)], var_name="Slot", value_name="Player")
+    top_players = pd.melt(top_df, id_vars=["place"], value_vars=[f"Player {i}" for i in range(1, 7)], var_name="Slot", value_name="Player")
+
+    player_counts = all_players["Player"].value_counts().rename("All Entries")
+    top_counts = top_players["Player"].value_counts().rename("Top 1%")
+
+    trait_df = pd.concat([top_counts, player_counts], axis=1).fillna(0)
+    trait_df["Elite Hit Rate (%)"] = (trait_df["Top 1%"] / trait_df["All Entries"]) * 100
+    trait_df = trait_df.sort_values("Elite Hit Rate (%)", ascending=False)
+
+    # 🔗 Combo Detection
+    top_mask = df.index.isin(top_df.index)
+    combo_matrix = ComboMatrix.from_entries(df)
+    combo_df = combo_matrix.combo_table(top_mask, top_label="Top 1%")
+    # Raw weekly files carry no positions or teams, so those columns are dropped
+    triple_df = ComboMiner.from_entries(df).combo_table(
+        3, {"Top 1%": top_mask}, min_support=TRIPLE_MIN_SUPPORT
+    ).drop(columns=["Positions", "Same Team"])
+
+    return {
+        "name": name,
+        "week": week,
+        "total_entries": total_entries,
+        "top_cutoff": top_cutoff,
+        "traits": trait_df,
+        "combos": combo_df,
+        "triples": triple_df,
+    }
+
+
+def scan_weeks(week_files, workers=None, cache=None):
+    """Run `scan_week` for every file across `workers` processes, in input order.
+
+    With a `cache` (a `ViewCache`), each week's scan is memoized on that
+    file's contents, so only new or changed uploads are read and scanned.
+    """
+    week_files = list(week_files)
+    if cache is None:
+        return map_weeks(scan_week, week_files, workers=workers)
+
+    keys = [content_key([week_file]) for week_file in week_files]
+    scans = [cache.peek("scan_week", key) for key in keys]
+    missing = [i for i, scan in enumerate(scans) if scan is None]
+    if missing:
+        with stage("trait_scanner", rows=len(missing)):
+            fresh = map_weeks(scan_week, [week_files[i] for i in missing], workers=workers)
+        for i, scan in zip(missing, fresh):
+            cache.put("scan_week", keys[i], scan)
+            scans[i] = scan
+    return scans
@@ -0,0 +1,140 @@
+import numpy as np
+import pandas as pd
+
+from .layout import PLAYER_COLUMNS, POS_COLUMNS, TEAM_COLUMNS, encode_columns
+from .tiers import TIER_COLUMNS
+
+# Slot index pairs (i, j) with i < j, in the order the original loops visited them
+SLOT_PAIRS = [(i, j) for i in range(6) for j in range(i + 1, 6)]
+
+
+def detect_stack(row):
+    teams = [row[f"Team {i}"] for i in range(1, 7)]
+    return len(set(teams)) < 6  # True if any teammates exist
+
+
+def classify_stack(row):
+    teams = [row[f"Team {i}"] for i in range(1, 7)]
+    positions = [row[f"Pos {i}"] for i in range(1, 7)]
+    team_counts = pd.Series(teams).value_counts()
+    has_qb_stack = False
+    has_mini_stack = False
+    for team, count in team_counts.items():
+        if count >= 2:
+            qbs = [i for i in range(6) if teams[i] == team and positions[i] == "QB"]
+            if qbs:
+                has_qb_stack = True
+            else:
+                has_mini_stack = True
+    if has_qb_stack:
+        return "QB Stack"
+    elif has_mini_stack:
+        return "Mini Stack"
+    else:
+        return "Unstacked"
+
+
+def stack_labels_rowwise(entries_df):
+    """Reference row-by-row labels, kept for parity checks."""
+    return pd.DataFrame({
+        "Stacked": entries_df.apply(detect_stack, axis=1).astype(bool),
+        "Stack Type": entries_df.apply(classify_stack, axis=1),
+    }, index=entries_df.index)
+
+
+class StackEngine:
+    """Stack labels and same-team pair records for every entry, built once per dataset.
+
+    Works on integer-coded `Team 1..6` / `Pos 1..6` / `Player 1..6` arrays.
+    Labels follow `detect_stack` / `classify_stack` exactly, so "Unknown"
+    teams still count as teammates there; pair records skip them like the
+    player-level combo loop did.
+    """
+
+    def __init__(self, labels, pair_entries, pair_a, pair_b, pair_has_qb, players):
+        self.labels = labels
+        self.pair_entries = pair_entries
+        self.pair_a = pair_a
+        self.pair_b = pair_b
+        self.pair_has_qb = pair_has_qb
+        self.players = players
+
+    @classmethod
+    def from_entries(cls, entries_df):
+        teams, team_names = encode_columns(entries_df, TEAM_COLUMNS)
+        players, player_names = encode_columns(entries_df, PLAYER_COLUMNS)
+        is_qb = (entries_df[POS_COLUMNS] == "QB").to_numpy()
+
+        # same_team[n, i, j]: slots i and j of entry n share a team
+        same_team = teams[:, :, None] == teams[:, None, :]
+        in_group = same_team.sum(axis=2) > 1
+        team_has_qb = (same_team & is_qb[:, None, :]).any(axis=2)
+        stacked = in_group.any(axis=1)
+        has_qb_stack = (in_group & team_has_qb).any(axis=1)
+        has_mini_stack = (in_group & ~team_has_qb).any(axis=1)
+
+        labels = pd.DataFrame({
+            "Stacked": stacked,
+            "Stack Type": np.select([has_qb_stack, has_mini_stack], ["QB Stack", "Mini Stack"], "Unstacked"),
+        }, index=entries_df.index)
+
+        unknown = np.flatnonzero(team_names == "Unknown")
+        slot_i = np.array([i for i, _ in SLOT_PAIRS])
+        slot_j = np.array([j for _, j in SLOT_PAIRS])
+        known = ~np.isin(teams[:, slot_i], unknown)
+        entry, pair = np.nonzero((teams[:, slot_i] == teams[:, slot_j]) & known)
+        first = players[entry, slot_i[pair]]
+        second = players[entry, slot_j[pair]]
+        pair_has_qb = is_qb[entry, slot_i[pair]] | is_qb[entry, slot_j[pair]]
+
+        return cls(
+            labels,
+            entry,
+            np.minimum(first, second),
+            np.maximum(first, second),
+            pair_has_qb,
+            player_names,
+        )
+
+    def pair_table(self, tier_masks, base_mask=None, min_support=1):
+        """Same-team pair counts with an elite count per tier.
+
+        `tier_masks` maps output column names (e.g. `"Elite_1%"`) to entry
+        masks. A pair including a QB is labelled "QB Stack", otherwise
+        "Mini Stack". Pairs drafted fewer than `min_support` times are
+        dropped before any per-tier counting.
+        """
+        keep = np.ones(len(self.pair_entries), dtype=bool)
+        if base_mask is not None:
+            keep = np.asarray(base_mask, dtype=bool)[self.pair_entries]
+        entries = self.pair_entries[keep]
+        keys = self.pair_a[keep] * len(self.players) + self.pair_b[keep]
+        unique_keys, first, inverse = np.unique(keys, return_index=True, return_inverse=True)
+        totals = np.bincount(inverse, minlength=len(unique_keys))
+
+        if min_support > 1:
+            supported = totals >= min_support
+            in_table = supported[inverse]
+            entries, inverse = entries[in_table], (np.cumsum(supported) - 1)[inverse[in_table]]
+            unique_keys, first, totals = unique_keys[supported], first[supported], totals[supported]
+
+        summary = pd.DataFrame({
+            "Player A": self.players[unique_keys // len(self.players)],
+            "Player B": self.players[unique_keys % len(self.players)],
+            "Combo Type": np.where(self.pair_has_qb[keep][first], "QB Stack", "Mini Stack"),
+            "Total Entries": totals,
+        })
+        for label, mask in tier_masks.items():
+            weights = np.asarray(mask, dtype=bool)[entries]
+            summary[label] = np.bincount(inverse, weights=weights, minlength=len(unique_keys)).astype(int)
+        return summary
+
+
+def elite_masks(entries_df):
+    """Tier masks keyed by the Tab 7 `Elite_*` column names, in `TIERS` order."""
+    return {column.replace("Top_", "Elite_"): entries_df[column].to_numpy() for column in TIER_COLUMNS.values()}
+
+
+def stack_labels(entries_df):
+    """Per-entry `Stacked` flag and `Stack Type` label."""
+    return StackEngine.from_entries(entries_df).labels
@@ -0,0 +1,144 @@
+import argparse
+import hashlib
+import io
+import json
+import os
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .ingest import add_total_entries, enrich_week, file_bytes, file_name, read_positions, week_label
+from .layout import compact_entries
+
+MANIFEST_NAME = "manifest.json"
+
+# Low-cardinality string columns stored dictionary-encoded
+CATEGORICAL_COLUMNS = (
+    ["username", "Week"]
+    + [f"Player {i}" for i in range(1, 7)]
+    + [f"Pos {i}" for i in range(1, 7)]
+    + [f"Team {i}" for i in range(1, 7)]
+)
+
+
+class SeasonStore:
+    """Directory of per-week Parquet partitions for one contest season.
+
+    Each imported `*_Week_N_DBQ.csv` becomes `week_N.parquet`, already
+    enriched with positions, teams, roles and tier flags. Importing a new
+    week writes one file and updates `manifest.json`; existing partitions are
+    never rewritten. `Total Entries` spans weeks, so it is added on load.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.manifest = self._read_manifest()
+
+    @classmethod
+    def exists(cls, root):
+        return os.path.exists(os.path.join(root, MANIFEST_NAME))
+
+    def _read_manifest(self):
+        path = os.path.join(self.root, MANIFEST_NAME)
+        if not os.path.exists(path):
+            return {"weeks": {}}
+        with open(path) as fh:
+            return json.load(fh)
+
+    def _write_manifest(self):
+        path = os.path.join(self.root, MANIFEST_NAME)
+        with open(path + ".tmp", "w") as fh:
+            json.dump(self.manifest, fh, indent=2, sort_keys=True)
+        os.replace(path + ".tmp", path)
+
+    @property
+    def weeks(self):
+        return sorted(self.manifest["weeks"], key=int)
+
+    def fingerprint(self):
+        """Hash of the manifest; changes whenever a partition is added or replaced."""
+        return hashlib.sha256(json.dumps(self.manifest, sort_keys=True).encode()).hexdigest()
+
+    def week_fingerprints(self):
+        """Content key per `Week N` label, from the hashes recorded at import."""
+        return {
+            f"Week {label}": f"{week['source_sha256']}-{week['positions_sha256']}"
+            for label, week in self.manifest["weeks"].items()
+        }
+
+    def import_week(self, week_file, positions_file):
+        """Enrich one weekly CSV and write it as its own partition.
+
+        Re-importing a week replaces only that week's partition.
+        """
+        os.makedirs(self.root, exist_ok=True)
+        label = week_label(week_file)
+        data = file_bytes(week_file)
+        positions_data = file_bytes(positions_file)
+
+        df = pd.read_csv(io.BytesIO(data))
+        df["Week"] = f"Week {label}"
+        df = enrich_week(df, read_positions(positions_file))
+        for col in CATEGORICAL_COLUMNS:
+            df[col] = df[col].astype("category")
+
+        partition = f"week_{label}.parquet"
+        path = os.path.join(self.root, partition)
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), path + ".tmp")
+        os.replace(path + ".tmp", path)
+
+        self.manifest["weeks"][label] = {
+            "file": partition,
+            "source": file_name(week_file),
+            "rows": len(df),
+            "source_sha256": hashlib.sha256(data).hexdigest(),
+            "positions_sha256": hashlib.sha256(positions_data).hexdigest(),
+        }
+        self._write_manifest()
+        return label
+
+    def read_week(self, label, categorical=False):
+        path = os.path.join(self.root, self.manifest["weeks"][label]["file"])
+        return _to_pandas(pq.read_table(path, memory_map=True), categorical)
+
+    def load(self, categorical=False, compact=False):
+        """Return the full season as an enriched `entries_df`.
+
+        Dictionary-encoded columns come back as plain strings unless
+        `categorical` is set; `compact` returns the shared-dictionary layout
+        from `compact_entries`.
+        """
+        tables = [
+            pq.read_table(os.path.join(self.root, self.manifest["weeks"][label]["file"]), memory_map=True)
+            for label in self.weeks
+        ]
+        entries_df = _to_pandas(pa.concat_tables(tables, promote_options="permissive"), categorical or compact)
+        entries_df = add_total_entries(entries_df)
+        return compact_entries(entries_df) if compact else entries_df
+
+
+def _to_pandas(table, categorical):
+    df = table.to_pandas()
+    if not categorical:
+        for col in CATEGORICAL_COLUMNS:
+            if isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype(str)
+    return df
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import weekly DBQ contest CSVs into a columnar season store.")
+    parser.add_argument("store", help="Season store directory")
+    parser.add_argument("week_files", nargs="+", help="*_Week_N_DBQ.csv files to import")
+    parser.add_argument("--positions", required=True, help="Position List Excel file")
+    args = parser.parse_args(argv)
+
+    store = SeasonStore(args.store)
+    for week_file in args.week_files:
+        label = store.import_week(week_file, args.positions)
+        print(f"Imported Week {label} from {file_name(week_file)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import io
+
+import numpy as np
+import pandas as pd
+
+from .combos import ComboMatrix, combo_frame
+from .cubes import ALL_ENTRIES, ALL_WEEKS, TIER_OPTIONS, AggregateCubes, tier_mask
+from .ingest import assign_roles, map_positions, read_positions, tag_week_tiers, week_label
+from .parallel import map_weeks
+from .stacks import StackEngine, elite_masks
+
+DEFAULT_CHUNKSIZE = 50_000
+
+
+def _csv_source(file):
+    # Paths are streamed from disk; uploaded files are already in memory
+    if hasattr(file, "getvalue"):
+        return io.BytesIO(file.getvalue())
+    return file
+
+
+def count_entries(week_file, chunksize=DEFAULT_CHUNKSIZE):
+    """Number of entries in a weekly CSV, reading only the `place` column."""
+    return sum(len(chunk) for chunk in pd.read_csv(_csv_source(week_file), usecols=["place"], chunksize=chunksize))
+
+
+def iter_week_chunks(week_file, position_df, chunksize=DEFAULT_CHUNKSIZE):
+    """Yield enriched chunks of one weekly CSV.
+
+    The file is read twice: once for its entry count, which fixes the tier
+    cutoffs, and once in `chunksize`-row pieces that are mapped, role-tagged
+    and tier-tagged independently.
+    """
+    total = count_entries(week_file, chunksize)
+    label = f"Week {week_label(week_file)}"
+    for chunk in pd.read_csv(_csv_source(week_file), chunksize=chunksize):
+        chunk["Week"] = label
+        chunk = map_positions(chunk, position_df)
+        chunk = assign_roles(chunk)
+        yield tag_week_tiers(chunk, total)
+
+
+class StreamingAggregates:
+    """Aggregates folded chunk by chunk so memory is bounded by chunk size.
+
+    Holds the same `AggregateCubes` the dashboard tabs read, plus pair and
+    same-team pair counts per week. Only per-user, per-player and per-pair
+    totals are kept, never the entries themselves.
+    """
+
+    def __init__(self):
+        self.cubes = None
+        self.entries = {}
+        self.pairs = {}
+        self.stack_pairs = {}
+
+    def add_chunk(self, chunk):
+        stack_engine = StackEngine.from_entries(chunk)
+        cubes = AggregateCubes.from_entries(chunk, labels=stack_engine.labels)
+        self.cubes = cubes if self.cubes is None else self.cubes.merge(cubes)
+
+        combo_matrix = ComboMatrix.from_entries(chunk)
+        tier_masks = elite_masks(chunk)
+        for week, rows in chunk.groupby("Week").indices.items():
+            week_mask = np.zeros(len(chunk), dtype=bool)
+            week_mask[rows] = True
+            self.entries[week] = self.entries.get(week, 0) + len(rows)
+
+            week_pairs = self.pairs.setdefault(week, {})
+            for tier in TIER_OPTIONS:
+                a, b, counts = combo_matrix.pair_counts(week_mask & tier_mask(chunk, tier).to_numpy())
+                index = pd.MultiIndex.from_arrays(
+                    [combo_matrix.players[a], combo_matrix.players[b]], names=["Player A", "Player B"]
+                )
+                week_pairs[tier] = _add(week_pairs.get(tier), pd.Series(counts, index=index))
+
+            stack_pairs = stack_engine.pair_table(tier_masks, base_mask=week_mask)
+            stack_pairs = stack_pairs.set_index(["Player A", "Player B", "Combo Type"])
+            self.stack_pairs[week] = _add(self.stack_pairs.get(week), stack_pairs)
+
+    def merge(self, other):
+        """Fold in aggregates built from other weeks or chunks."""
+        if other.cubes is None:
+            return self
+        self.cubes = other.cubes if self.cubes is None else self.cubes.merge(other.cubes)
+        for week, entries in other.entries.items():
+            self.entries[week] = self.entries.get(week, 0) + entries
+        for week, tiers in other.pairs.items():
+            week_pairs = self.pairs.setdefault(week, {})
+            for tier, pairs in tiers.items():
+                week_pairs[tier] = _add(week_pairs.get(tier), pairs)
+        for week, stack_pairs in other.stack_pairs.items():
+            self.stack_pairs[week] = _add(self.stack_pairs.get(week), stack_pairs)
+        return self
+
+    def _selected_weeks(self, week):
+        return list(self.pairs) if week == ALL_WEEKS else [week]
+
+    def combo_table(self, tier, week=ALL_WEEKS):
+        """Tab 4 combo table for a tier and week."""
+        all_pairs = top_pairs = None
+        for selected in self._selected_weeks(week):
+            all_pairs = _add(all_pairs, self.pairs[selected][ALL_ENTRIES])
+            top_pairs = _add(top_pairs, self.pairs[selected][tier])
+        return combo_frame(
+            all_pairs.index.get_level_values("Player A"),
+            all_pairs.index.get_level_values("Player B"),
+            top_pairs.reindex(all_pairs.index, fill_value=0).astype(int).to_numpy(),
+            all_pairs.astype(int).to_numpy(),
+        )
+
+    def stack_pair_table(self, week=ALL_WEEKS):
+        """Tab 7 player-level stack combo counts for a week."""
+        stack_pairs = None
+        for selected in self._selected_weeks(week):
+            stack_pairs = _add(stack_pairs, self.stack_pairs[selected])
+        return stack_pairs.astype(int).reset_index()
+
+
+def _add(total, part):
+    if total is None:
+        return part
+    return total.add(part, fill_value=0).fillna(0)
+
+
+def _stream_week(week_file, position_df, chunksize):
+    aggregates = StreamingAggregates()
+    for chunk in iter_week_chunks(week_file, position_df, chunksize):
+        aggregates.add_chunk(chunk)
+    return aggregates
+
+
+def stream_aggregates(week_files, positions_file, chunksize=DEFAULT_CHUNKSIZE, workers=None):
+    """Build `StreamingAggregates` for every week file, one chunk at a time.
+
+    Weeks are streamed in parallel across `workers` processes and merged.
+    """
+    position_df = read_positions(positions_file)
+    aggregates = StreamingAggregates()
+    for week_aggregates in map_weeks(_stream_week, list(week_files), position_df, chunksize, workers=workers):
+        aggregates.merge(week_aggregates)
+    return aggregates
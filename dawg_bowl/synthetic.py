@@ -0,0 +1,163 @@
+import argparse
+import os
+
+import numpy as np
+import pandas as pd
+
+from .layout import PLAYER_COLUMNS
+
+# Share of the player pool at each position, roughly as in the bundled Position List
+POSITION_SHARES = {"QB": 0.12, "RB": 0.25, "WR": 0.42, "TE": 0.21}
+# Relative draft value by position; RBs and WRs go early, QBs and TEs later
+POSITION_VALUE = {"QB": 0.5, "RB": 1.2, "WR": 1.0, "TE": 0.4}
+# Mean and spread of one player's weekly best-ball score by position
+POSITION_POINTS = {"QB": (14.0, 5.0), "RB": (11.0, 5.0), "WR": (11.5, 5.0), "TE": (8.0, 4.0)}
+# (share of the field, payout) from the top down; everyone below the last line gets 0
+PAYOUT_LADDER = [(0.0005, 10000.0), (0.002, 500.0), (0.01, 100.0), (0.05, 35.0), (0.19, 30.0)]
+# Candidates sampled per lineup before stacks displace some of them
+CANDIDATES = len(PLAYER_COLUMNS) + 3
+CHUNK_SIZE = 50_000
+
+
+def synthetic_positions(n_players=300, n_teams=32, seed=0):
+    """A Position List with `Name`, `Position`, `Team` columns for a synthetic pool."""
+    rng = np.random.default_rng(seed)
+    positions = rng.choice(list(POSITION_SHARES), size=n_players, p=list(POSITION_SHARES.values()))
+    teams = np.array([f"T{i:02d}" for i in range(1, n_teams + 1)])
+    return pd.DataFrame({
+        "Name": [f"Synthetic {pos} {i:04d}" for i, pos in enumerate(positions, 1)],
+        "Position": positions,
+        "Team": rng.choice(teams, size=n_players),
+    })
+
+
+class ContestGenerator:
+    """Draws DBQ-format weekly contests over a fixed synthetic player pool.
+
+    Player popularity is Zipf-like and lineups are ordered by a per-player
+    ADP, so `Player 1` is the earliest pick as in the real exports. With
+    probability `stack_rate` an entry is built around a QB plus one or two
+    pass catchers from the same team. Entrant volume is skewed the same way,
+    so a few users play many entries.
+    """
+
+    def __init__(self, positions_df, entries_per_user=4.6, stack_rate=0.4, seed=0):
+        self.positions_df = positions_df
+        self.entries_per_user = entries_per_user
+        self.stack_rate = stack_rate
+        self.rng = np.random.default_rng(seed)
+
+        n_players = len(positions_df)
+        self.names = positions_df["Name"].to_numpy(dtype=object)
+        self.position = positions_df["Position"].to_numpy(dtype=object)
+        team_codes, self.teams = pd.factorize(positions_df["Team"])
+        self.team = team_codes
+        value = self.rng.exponential(size=n_players) * np.array([POSITION_VALUE[pos] for pos in self.position])
+        self.adp = np.argsort(np.argsort(-value))
+        self.log_weight = -np.log1p(self.adp) * 0.8
+
+        self.qbs = np.flatnonzero(self.position == "QB")
+        catchers = np.isin(self.position, ["WR", "TE"])
+        # catchers_by_team[t]: pass catchers on team t, for building stacks
+        self.catchers_by_team = [np.flatnonzero(catchers & (self.team == t)) for t in range(len(self.teams))]
+
+    def _lineups(self, n_entries):
+        rng = self.rng
+        # Weighted sampling without replacement via the Gumbel top-k trick
+        keys = self.log_weight + rng.gumbel(size=(n_entries, len(self.names)))
+        candidates = np.argpartition(-keys, CANDIDATES, axis=1)[:, :CANDIDATES]
+
+        fixed = np.full((n_entries, 3), -1)
+        stacked = np.flatnonzero(rng.random(n_entries) < self.stack_rate)
+        if len(stacked) and len(self.qbs):
+            qbs = rng.choice(self.qbs, size=len(stacked), p=_softmax(self.log_weight[self.qbs]))
+            fixed[stacked, 0] = qbs
+            n_mates = rng.integers(1, 3, size=len(stacked))
+            for i, (entry, qb) in enumerate(zip(stacked, qbs)):
+                mates = self.catchers_by_team[self.team[qb]]
+                if len(mates):
+                    chosen = rng.choice(mates, size=min(n_mates[i], len(mates)), replace=False)
+                    fixed[entry, 1:1 + len(chosen)] = chosen
+
+        # Drop candidates already taken by the stack, then fill up to six players
+        taken = (candidates[:, :, None] == fixed[:, None, :]).any(axis=2)
+        candidates = np.where(taken, -1, candidates)
+        pool = np.concatenate([fixed, candidates], axis=1)
+        pool = np.take_along_axis(pool, np.argsort(pool < 0, axis=1, kind="stable"), axis=1)
+        lineups = pool[:, :len(PLAYER_COLUMNS)]
+        return np.take_along_axis(lineups, np.argsort(self.adp[lineups], axis=1), axis=1)
+
+    def week(self, n_entries):
+        """One week's contest as a DBQ-format frame, sorted by place."""
+        rng = self.rng
+        lineups = np.concatenate([
+            self._lineups(min(CHUNK_SIZE, n_entries - start)) for start in range(0, n_entries, CHUNK_SIZE)
+        ])
+
+        means = np.array([POSITION_POINTS[pos][0] for pos in self.position])
+        spreads = np.array([POSITION_POINTS[pos][1] for pos in self.position])
+        player_points = np.clip(rng.normal(means, spreads), 0, None)
+        points = np.round(player_points[lineups].sum(axis=1) + rng.normal(0, 4, size=n_entries), 2)
+
+        n_users = max(1, int(n_entries / self.entries_per_user))
+        user_weights = 1 / np.arange(1, n_users + 1) ** 0.9
+        users = rng.choice(n_users, size=n_entries, p=user_weights / user_weights.sum())
+
+        df = pd.DataFrame({
+            "place": pd.Series(-points).rank(method="min").astype(int).to_numpy(),
+            "payout": 0.0,
+            "points": points,
+            "username": np.char.add("user", np.char.zfill(users.astype(str), 6)),
+        })
+        for i, col in enumerate(PLAYER_COLUMNS):
+            df[col] = self.names[lineups[:, i]]
+        df = df.sort_values("place", kind="stable").reset_index(drop=True)
+
+        for share, payout in reversed(PAYOUT_LADDER):
+            df.loc[df["place"] <= max(1, round(share * n_entries)), "payout"] = payout
+        return df
+
+
+def _softmax(log_weights):
+    weights = np.exp(log_weights - log_weights.max())
+    return weights / weights.sum()
+
+
+def write_contest(out_dir, weeks=7, entries_per_week=5000, n_players=300, stack_rate=0.4, seed=0):
+    """Write `SYN_Week_N_DBQ.csv` files and a `Position List.xlsx` to `out_dir`.
+
+    Returns `(week_files, positions_file)`.
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    positions_df = synthetic_positions(n_players, seed=seed)
+    positions_file = os.path.join(out_dir, "Position List.xlsx")
+    positions_df.to_excel(positions_file, index=False)
+
+    generator = ContestGenerator(positions_df, stack_rate=stack_rate, seed=seed)
+    week_files = []
+    for week in range(1, weeks + 1):
+        path = os.path.join(out_dir, f"SYN_Week_{week}_DBQ.csv")
+        generator.week(entries_per_week).to_csv(path, index=False)
+        week_files.append(path)
+    return week_files, positions_file
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate synthetic DBQ contest files for testing and benchmarks.")
+    parser.add_argument("out_dir", help="Directory to write week CSVs and the Position List into")
+    parser.add_argument("--weeks", type=int, default=7)
+    parser.add_argument("--entries", type=int, default=5000, help="Entries per week")
+    parser.add_argument("--players", type=int, default=300, help="Player pool size")
+    parser.add_argument("--stack-rate", type=float, default=0.4, help="Share of entries built around a QB stack")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    week_files, positions_file = write_contest(
+        args.out_dir, args.weeks, args.entries, args.players, args.stack_rate, args.seed
+    )
+    for path in week_files + [positions_file]:
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
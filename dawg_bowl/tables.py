@@ -0,0 +1,52 @@
+import math
+
+import numpy as np
+import pandas as pd
+
+PAGE_SIZES = [25, 50, 100, 250]
+
+
+def page_count(n_rows, page_size):
+    return max(1, math.ceil(n_rows / page_size))
+
+
+def top_positions(values, k, ascending=False):
+    """Positions of the first `k` values in stable sort order, without sorting the rest.
+
+    Rows tied with the k-th value are taken in their original order, so every
+    prefix agrees with a full stable sort and consecutive pages never overlap.
+    Missing values sort last.
+    """
+    keys = np.asarray(values, dtype=float)
+    keys = np.where(np.isnan(keys), np.inf, keys if ascending else -keys)
+    if k >= len(keys):
+        return np.argsort(keys, kind="stable")
+    if k <= 0:
+        return np.empty(0, dtype=np.intp)
+
+    kth = np.partition(keys, k - 1)[k - 1]
+    better = np.flatnonzero(keys < kth)
+    tied = np.flatnonzero(keys == kth)[: k - len(better)]
+    chosen = np.concatenate([better, tied])
+    return chosen[np.lexsort((chosen, keys[chosen]))]
+
+
+def table_page(frame, page=1, page_size=50, sort_by=None, ascending=False):
+    """One page of `frame` in `sort_by` order, and the page number actually shown.
+
+    Numeric columns only select the rows up to the end of the page (see
+    `top_positions`); other columns are fully sorted. Only the page's rows
+    are copied, so formatting and display cost does not grow with the table.
+    """
+    page = min(max(int(page), 1), page_count(len(frame), page_size))
+    start = (page - 1) * page_size
+    stop = start + page_size
+    if sort_by is None:
+        positions = np.arange(start, min(stop, len(frame)))
+    elif pd.api.types.is_numeric_dtype(frame[sort_by]):
+        values = frame[sort_by].to_numpy(dtype=float, na_value=np.nan)
+        positions = top_positions(values, stop, ascending)[start:]
+    else:
+        column = frame[sort_by].reset_index(drop=True)
+        positions = column.sort_values(ascending=ascending, kind="stable").index.to_numpy()[start:stop]
+    return frame.iloc[positions], page
@@ -0,0 +1,40 @@
+import numpy as np
+
+from .perf import stage
+
+# Tier label → (flag column, fraction of the week's field), in dashboard display order.
+# Add e.g. "Top 5%": ("Top_5%", 0.05) here to tag and offer another tier.
+TIERS = {
+    "Top 1%": ("Top_1%", 0.01),
+    "Top 0.5%": ("Top_0.5%", 0.005),
+    "Top 0.1%": ("Top_0.1%", 0.001),
+}
+
+TIER_COLUMNS = {label: column for label, (column, _) in TIERS.items()}
+TIER_LABELS = {column: label for label, column in TIER_COLUMNS.items()}
+
+# Flag columns from the narrowest tier to the widest, the order they sit in entries_df
+FLAG_COLUMNS = [column for column, _ in sorted(TIERS.values(), key=lambda tier: tier[1])]
+
+
+def tier_cutoffs(totals, tiers=None):
+    """Last qualifying place per tier: `max(1, round(p * total))` for each field size."""
+    tiers = TIERS if tiers is None else tiers
+    totals = np.asarray(totals)
+    return {column: np.maximum(1, np.round(fraction * totals)) for column, fraction in tiers.values()}
+
+
+def tag_tiers(df, totals, tiers=None):
+    """Set one boolean flag column per tier, in place.
+
+    `totals` is the field size for each row (or a single size for a one-week
+    frame). Every tier is a comparison against the same `place` array, so
+    extra tiers cost no extra pass over the groups.
+    """
+    tiers = TIERS if tiers is None else tiers
+    with stage("tag_tiers", rows=len(df)):
+        place = df["place"].to_numpy().astype(int)
+        cutoffs = tier_cutoffs(totals, tiers)
+        for column, _ in sorted(tiers.values(), key=lambda tier: tier[1]):
+            df[column] = place <= cutoffs[column]
+    return df
@@ -0,0 +1,175 @@
+import threading
+
+import pandas as pd
+
+from .cache import content_key
+from .combos import ComboMatrix
+from .cubes import PlayerRoundCounts
+from .ingest import week_label
+from .tiers import FLAG_COLUMNS, TIER_COLUMNS
+
+TREND_WINDOW = 3
+TREND_KINDS = {"players": ["Player"], "combos": ["Player A", "Player B"], "users": ["username"]}
+
+
+def week_number(week):
+    """Sort key for a `Week N` label."""
+    return int(str(week).removeprefix("Week "))
+
+
+def week_fingerprints(week_files, positions_file):
+    """Content key per `Week N` label, so a re-uploaded week is only re-aggregated if it changed."""
+    return {f"Week {week_label(f)}": content_key([f], positions_file) for f in week_files}
+
+
+def week_totals(week_df):
+    """Entries and tier-flag counts per player, pair and user for one week."""
+    players = PlayerRoundCounts.from_entries(week_df).summary()
+    players = players.rename(columns={"Total Appearances": "Entries"})
+
+    combo_matrix = ComboMatrix.from_entries(week_df)
+    a, b, counts = combo_matrix.pair_counts()
+    keys = combo_matrix.pair_keys(a, b)
+    pairs = pd.DataFrame(
+        {"Entries": counts},
+        index=pd.MultiIndex.from_arrays([combo_matrix.players[a], combo_matrix.players[b]], names=TREND_KINDS["combos"]),
+    )
+    for col in FLAG_COLUMNS:
+        pairs[col] = combo_matrix.pair_series(week_df[col].to_numpy()).reindex(keys, fill_value=0).to_numpy()
+
+    grouped = week_df.groupby(week_df["username"].astype(object))
+    users = grouped[FLAG_COLUMNS].sum().astype(int)
+    users.insert(0, "Entries", grouped.size())
+
+    return {
+        "players": players[["Entries"] + FLAG_COLUMNS],
+        "combos": pairs[["Entries"] + FLAG_COLUMNS],
+        "users": users,
+    }
+
+
+def _add(total, part, sign=1):
+    if total is None:
+        return part if sign > 0 else -part
+    total = total.add(sign * part, fill_value=0).astype(int)
+    return total[total["Entries"] > 0]
+
+
+class TrendEngine:
+    """Per-week totals and rolling windows, maintained one week at a time.
+
+    Each week is aggregated once (`week_totals`). The rolling window ending
+    at a week is the previous week's window plus the new week minus the
+    week that drops out, and ownership deltas only look at the previous
+    week. Appending the latest week therefore costs one week's aggregation;
+    inserting or replacing an earlier week re-rolls the windows after it
+    from stored totals. Weeks are ordered by number, not upload order.
+
+    An engine describes one dataset. To reuse week aggregates across
+    datasets (e.g. last week's season plus one new week), pass a shared
+    `totals_cache` (a `ViewCache`); weeks with a fingerprint are then
+    looked up by it before being aggregated.
+    """
+
+    def __init__(self, window=TREND_WINDOW, totals_cache=None):
+        self.window = window
+        self.totals_cache = totals_cache
+        self.totals = {}
+        self.rolling = {}
+        self.ownership = {}
+        self.entries = {}
+        self.fingerprints = {}
+        self._lock = threading.Lock()
+
+    @property
+    def weeks(self):
+        return sorted(self.totals, key=week_number)
+
+    def add_week(self, week_df, fingerprint=None):
+        """Fold in one week's entries, replacing any earlier copy of that week."""
+        week = week_df["Week"].iloc[0]
+        if self.totals_cache is not None and fingerprint is not None:
+            totals = self.totals_cache.get("trend_week_totals", fingerprint, lambda: week_totals(week_df))
+        else:
+            totals = week_totals(week_df)
+        with self._lock:
+            self.totals[week] = totals
+            self.entries[week] = len(week_df)
+            self.fingerprints[week] = fingerprint
+            self._roll_from(week)
+        return week
+
+    def remove_week(self, week):
+        with self._lock:
+            later = [w for w in self.weeks if week_number(w) > week_number(week)]
+            for store in (self.totals, self.rolling, self.ownership, self.entries, self.fingerprints):
+                store.pop(week, None)
+            if later:
+                self._roll_from(later[0])
+
+    def update(self, entries_df, fingerprints=None):
+        """Sync to the weeks in `entries_df`, aggregating only weeks that are new or changed.
+
+        Without `fingerprints` (week label → content key), a week already
+        held is assumed unchanged.
+        """
+        fingerprints = fingerprints or {}
+        week_rows = entries_df.groupby("Week", observed=True).indices
+        for week in [w for w in self.weeks if w not in week_rows]:
+            self.remove_week(week)
+        for week in sorted(week_rows, key=week_number):
+            fingerprint = fingerprints.get(week)
+            if week not in self.totals or (fingerprint is not None and fingerprint != self.fingerprints[week]):
+                self.add_week(entries_df.iloc[week_rows[week]], fingerprint)
+        return self
+
+    def _roll_from(self, week):
+        # Re-derive windows and deltas from `week` onwards; appending the latest week touches only that week
+        weeks = self.weeks
+        for i in range(weeks.index(week), len(weeks)):
+            current = weeks[i]
+            previous = weeks[i - 1] if i > 0 else None
+            dropped = weeks[i - self.window] if i >= self.window else None
+            rolling = {}
+            for kind, totals in self.totals[current].items():
+                window = _add(self.rolling[previous][kind] if previous else None, totals)
+                if dropped:
+                    window = _add(window, self.totals[dropped][kind], sign=-1)
+                rolling[kind] = window
+            self.rolling[current] = rolling
+            self.ownership[current] = self.totals[current]["players"]["Entries"] / self.entries[current] * 100
+
+    def trend_table(self, kind, tier="Top 1%", min_entries=1):
+        """Week-by-week rolling hit rates for `kind` ("players", "combos" or "users").
+
+        Rows whose rolling window has fewer than `min_entries` drafts are
+        dropped. Player rows also carry that week's ownership and its change
+        from the previous week (missing for the first week).
+        """
+        flag = TIER_COLUMNS[tier]
+        frames = {}
+        with self._lock:
+            weeks = self.weeks
+            for i, week in enumerate(weeks):
+                rolling = self.rolling[week][kind]
+                rolling = rolling[rolling["Entries"] >= min_entries]
+                weekly = self.totals[week][kind].reindex(rolling.index, fill_value=0)
+                frame = pd.DataFrame({
+                    "Entries": weekly["Entries"],
+                    "Elite Hits": weekly[flag],
+                    "Rolling Entries": rolling["Entries"],
+                    "Rolling Elite Hits": rolling[flag],
+                })
+                frame["Rolling Hit Rate (%)"] = frame["Rolling Elite Hits"] / frame["Rolling Entries"] * 100
+                if kind == "players":
+                    frame["Ownership (%)"] = self.ownership[week].reindex(frame.index, fill_value=0)
+                    if i > 0:
+                        last = self.ownership[weeks[i - 1]].reindex(frame.index, fill_value=0)
+                        frame["Ownership Δ (pp)"] = frame["Ownership (%)"] - last
+                    else:
+                        frame["Ownership Δ (pp)"] = float("nan")
+                frames[week] = frame
+        if not frames:
+            return pd.DataFrame(columns=["Week"] + TREND_KINDS[kind])
+        trends = pd.concat(frames, names=["Week"])
+        return trends.reset_index()
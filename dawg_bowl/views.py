@@ -0,0 +1,54 @@
+import threading
+
+from .perf import stage
+
+_MISSING = object()
+
+
+class ViewCache:
+    """Bounded cache of computed view results, keyed on a view name and its filters.
+
+    A view is recomputed only when one of its own inputs changes, so
+    unrelated widget changes cost a dictionary lookup. Misses are recorded
+    as a `stage` named after the view. Results are shared across reruns and
+    sessions, so callers must treat them as read-only.
+    """
+
+    def __init__(self, max_items=256):
+        self.max_items = max_items
+        self._results = {}
+        self._lock = threading.Lock()
+
+    def get(self, view, key, compute):
+        """Return the cached result for `(view, key)`, calling `compute()` on a miss."""
+        result = self.peek(view, key, _MISSING)
+        if result is not _MISSING:
+            return result
+
+        with stage(view) as record:
+            result = compute()
+            if hasattr(result, "shape"):
+                record["rows"] = len(result)
+        self.put(view, key, result)
+        return result
+
+    def peek(self, view, key, default=None):
+        """Return the cached result for `(view, key)`, or `default` without computing anything."""
+        cache_key = (view, key)
+        with self._lock:
+            if cache_key not in self._results:
+                return default
+            # Re-insert to mark as most recently used
+            self._results[cache_key] = self._results.pop(cache_key)
+            return self._results[cache_key]
+
+    def put(self, view, key, result):
+        """Store a result computed elsewhere, e.g. in a batch of misses."""
+        with self._lock:
+            self._results[(view, key)] = result
+            while len(self._results) > self.max_items:
+                self._results.pop(next(iter(self._results)))
+
+    def clear(self):
+        with self._lock:
+            self._results.clear()
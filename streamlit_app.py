@@ -1,8 +1,46 @@
 import streamlit as st
-import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
-from itertools import combinations
+import os
+
+from dawg_bowl import (
+    CHART_RENDERERS,
+    FLAG_COLUMNS,
+    PAGE_SIZES,
+    RATE_COLUMNS,
+    TIER_COLUMNS,
+    AggregateCubes,
+    ComboMatrix,
+    ComboMiner,
+    EntriesCache,
+    EntryIndex,
+    PerfRecorder,
+    SeasonStore,
+    StackEngine,
+    TrendEngine,
+    ViewCache,
+    anchor_counts,
+    anchor_flow,
+    anchor_flow_png,
+    anchor_flow_spec,
+    content_key,
+    elite_masks,
+    heatmap_counts,
+    heatmap_png,
+    heatmap_spec,
+    load_entries,
+    page_count,
+    player_rate_table,
+    scan_weeks,
+    set_recorder,
+    stack_pair_table,
+    stack_table,
+    stack_type_table,
+    stage,
+    table_key,
+    table_page,
+    tier_label_masks,
+    user_table,
+    week_fingerprints,
+)
 
 st.set_page_config(page_title="Dawg Bowl Contest Dashboard", layout="wide")
 
@@ -13,6 +51,113 @@ mode = st.sidebar.selectbox("Choose Mode", ["Dashboard", "Elite Trait Scanner"])
 st.sidebar.header("📥 Upload Contest Files")
 uploaded_weeks = st.sidebar.file_uploader("Upload weekly CSVs", type="csv", accept_multiple_files=True)
 uploaded_positions = st.sidebar.file_uploader("Upload Position List Excel", type=["xls", "xlsx"])
+store_dir = st.sidebar.text_input("Season store directory (optional)", os.environ.get("DAWG_BOWL_STORE", ""))
+default_renderer = os.environ.get("DAWG_BOWL_CHARTS", "Matplotlib")
+chart_renderer = st.sidebar.selectbox(
+    "Chart renderer",
+    CHART_RENDERERS,
+    index=CHART_RENDERERS.index(default_renderer) if default_renderer in CHART_RENDERERS else 0,
+)
+
+# 🔹 Opt-in performance instrumentation
+recorder = None
+if st.sidebar.checkbox("⏱️ Record performance", value=os.environ.get("DAWG_BOWL_PERF") == "1"):
+    trace_memory = st.sidebar.checkbox("Trace peak memory (slower)")
+    perf_log = st.sidebar.text_input("Performance log file (optional)", os.environ.get("DAWG_BOWL_PERF_LOG", ""))
+    recorder = PerfRecorder(trace_memory=trace_memory)
+set_recorder(recorder)
+
+# 🔹 Ingestion cache shared across reruns and sessions
+@st.cache_resource
+def get_entries_cache():
+    return EntriesCache(cache_dir=os.environ.get("DAWG_BOWL_CACHE_DIR"))
+
+# 🔹 Season store loads, keyed on the store manifest
+@st.cache_resource(max_entries=2)
+def get_store_entries(dataset_key, _season_store):
+    with stage("store_load"):
+        return _season_store.load(compact=True)
+
+# 🔹 Pair co-occurrence matrix, built once per dataset
+@st.cache_resource(max_entries=4)
+def get_combo_matrix(dataset_key, _entries_df):
+    with stage("combo_matrix", rows=len(_entries_df)):
+        return ComboMatrix.from_entries(_entries_df)
+
+# 🔹 Sorted lineups for 3- and 4-player combo mining, built once per dataset
+@st.cache_resource(max_entries=4)
+def get_combo_miner(dataset_key, _entries_df):
+    with stage("combo_miner", rows=len(_entries_df)):
+        return ComboMiner.from_entries(_entries_df)
+
+# 🔹 Stack labels and same-team pairs, shared by both stacking tabs
+@st.cache_resource(max_entries=4)
+def get_stack_engine(dataset_key, _entries_df):
+    with stage("stack_engine", rows=len(_entries_df)):
+        return StackEngine.from_entries(_entries_df)
+
+# 🔹 Username / player / team inverted index, built once per dataset
+@st.cache_resource(max_entries=4)
+def get_entry_index(dataset_key, _entries_df):
+    with stage("entry_index", rows=len(_entries_df)):
+        return EntryIndex.from_entries(_entries_df)
+
+# 🔹 Memoized per-view results, shared across reruns
+@st.cache_resource
+def get_view_cache():
+    return ViewCache()
+
+# 🔹 Per-week trend totals keyed on week content, shared so a new dataset only aggregates its new weeks
+@st.cache_resource
+def get_week_totals_cache():
+    return ViewCache(max_items=64)
+
+# 🔹 Cross-week trends for one dataset, assembled from the shared per-week totals
+@st.cache_resource(max_entries=4)
+def get_trend_engine(dataset_key, _entries_df, _fingerprints):
+    with stage("trend_engine", rows=len(_entries_df)):
+        return TrendEngine(totals_cache=get_week_totals_cache()).update(_entries_df, _fingerprints)
+
+# 🔹 Rendered charts (PNG bytes or Vega-Lite specs), bounded LRU shared across reruns
+@st.cache_resource
+def get_chart_cache():
+    return ViewCache(max_items=64)
+
+# 🔹 Per-week aggregate cubes, built once per dataset
+@st.cache_resource(max_entries=4)
+def get_aggregate_cubes(dataset_key, _entries_df, _stack_engine):
+    with stage("aggregate_cubes", rows=len(_entries_df)):
+        return AggregateCubes.from_entries(_entries_df, labels=_stack_engine.labels)
+
+# 🔹 Result tables, sorted and paged server-side
+def show_result_table(table, key, sort_by, formats=None):
+    """Render one page of `table`; only the visible rows are formatted and sent to the browser."""
+    if table.empty:
+        st.dataframe(table)
+        return
+
+    columns = list(table.columns)
+    sort_col, order_col, size_col, page_col = st.columns(4)
+    sort_by = sort_col.selectbox("Sort by", columns, index=columns.index(sort_by), key=f"{key}_sort_by")
+    ascending = order_col.selectbox("Order", ["Descending", "Ascending"], key=f"{key}_order") == "Ascending"
+    page_size = size_col.selectbox("Rows per page", PAGE_SIZES, index=1, key=f"{key}_page_size")
+    page = page_col.number_input("Page", min_value=1, value=1, key=f"{key}_page")
+
+    rows, page = table_page(table, page, page_size, sort_by, ascending)
+    first = (page - 1) * page_size
+    st.caption(
+        f"Rows {first + 1:,}–{first + len(rows):,} of {len(table):,} "
+        f"(page {page} of {page_count(len(table), page_size)})"
+    )
+    st.dataframe(rows.style.format(formats or {}))
+
+# 🔹 Charts, re-rendered only when their input table or title changes
+def show_chart(name, table, title, png, spec):
+    key = (table_key(table), title)
+    if chart_renderer == "Vega-Lite":
+        st.vega_lite_chart(spec=get_chart_cache().get(f"{name}_spec", key, lambda: spec(table, title)), width="stretch")
+    else:
+        st.image(get_chart_cache().get(f"{name}_png", key, lambda: png(table, title)), width="stretch")
 
 # 🔹 Trait Scanner Function
 def run_trait_scanner(uploaded_files):
@@ -21,500 +166,349 @@ def run_trait_scanner(uploaded_files):
         st.info("📥 Please upload contest CSVs in the Dashboard tab first.")
         return
 
-    for file in uploaded_files:
-        try:
-            df = pd.read_csv(file)
-            week_label = file.name.split("_Week_")[1].split("_")[0]
-        except Exception as e:
-            st.error(f"Error reading {file.name}: {e}")
-            continue
-
-        total_entries = len(df)
-        top_cutoff = max(1, int(total_entries * 0.01))
-        top_df = df.nsmallest(top_cutoff, "place")
-
-        st.subheader(f"📅 Week {week_label}")
-        st.markdown(f"**Total Entries:** {total_entries}  \n**Top 1% Cutoff:** Top {top_cutoff} entries")
-
-        all_players = pd.melt(df, id_vars=["place"], value_vars=[f"Player {i}" for i in range(1, 7)], var_name="Slot", value_name="Player")
-        top_players = pd.melt(top_df, id_vars=["place"], value_vars=[f"Player {i}" for i in range(1, 7)], var_name="Slot", value_name="Player")
+    # Each week is memoized on its contents, so paging the tables below never re-scans
+    # and adding one week's upload scans only that week
+    scans = scan_weeks(uploaded_files, cache=get_view_cache())
 
-        player_counts = all_players["Player"].value_counts().rename("All Entries")
-        top_counts = top_players["Player"].value_counts().rename("Top 1%")
-
-        trait_df = pd.concat([top_counts, player_counts], axis=1).fillna(0)
-        trait_df["Elite Hit Rate (%)"] = (trait_df["Top 1%"] / trait_df["All Entries"]) * 100
-        trait_df = trait_df.sort_values("Elite Hit Rate (%)", ascending=False)
-
-        st.dataframe(trait_df.style.format({"Elite Hit Rate (%)": "{:.2f}"}))
-
-        # 🔗 Combo Detection
-        combo_records = []
-        for _, row in top_df.iterrows():
-            players = [row[f"Player {i}"] for i in range(1, 7)]
-            for pair in combinations(sorted(players), 2):
-                combo_records.append(tuple(pair))
-        top_combo_counts = pd.Series(combo_records).value_counts().rename("Top 1%")
+    for i, scan in enumerate(scans):
+        if "error" in scan:
+            st.error(f"Error reading {scan['name']}: {scan['error']}")
+            continue
 
-        combo_records_all = []
-        for _, row in df.iterrows():
-            players = [row[f"Player {i}"] for i in range(1, 7)]
-            for pair in combinations(sorted(players), 2):
-                combo_records_all.append(tuple(pair))
-        all_combo_counts = pd.Series(combo_records_all).value_counts().rename("All Entries")
+        st.subheader(f"📅 Week {scan['week']}")
+        st.markdown(f"**Total Entries:** {scan['total_entries']}  \n**Top 1% Cutoff:** Top {scan['top_cutoff']} entries")
 
-        combo_df = pd.concat([top_combo_counts, all_combo_counts], axis=1).fillna(0)
-        combo_df["Elite Hit Rate (%)"] = (combo_df["Top 1%"] / combo_df["All Entries"]) * 100
-        combo_df = combo_df.reset_index().rename(columns={"index": "Combo"})
-        combo_df[["Player A", "Player B"]] = pd.DataFrame(combo_df["Combo"].tolist(), index=combo_df.index)
-        combo_df = combo_df[["Player A", "Player B", "Top 1%", "All Entries", "Elite Hit Rate (%)"]]
-        combo_df = combo_df.sort_values("Elite Hit Rate (%)", ascending=False)
+        st.dataframe(scan["traits"].style.format({"Elite Hit Rate (%)": "{:.2f}"}))
 
         st.subheader("🔗 High-Impact Player Combos")
-        st.dataframe(combo_df.style.format({"Elite Hit Rate (%)": "{:.2f}"}))
-
-# 🔹 Dashboard Mode
-if mode == "Dashboard":
-    if uploaded_weeks and uploaded_positions:
-        # 🔹 Load and process data
-        all_weeks = []
-        for file in uploaded_weeks:
-            week_label = file.name.split("_Week_")[1].split("_")[0]
-            df = pd.read_csv(file)
-            df["Week"] = f"Week {week_label}"
-            all_weeks.append(df)
-        entries_df = pd.concat(all_weeks, ignore_index=True)
-
-        position_df = pd.read_excel(uploaded_positions)
-        # Normalize column names to avoid KeyError
-        position_df.columns = position_df.columns.str.strip().str.title()
-        position_map = dict(zip(position_df["Name"], position_df["Position"]))
-        team_map = dict(zip(position_df["Name"], position_df["Team"]))
-
-        for i in range(1, 7):
-            col = f"Player {i}"
-            pos_col = f"Pos {i}"
-            team_col = f"Team {i}"
-            entries_df[pos_col] = entries_df[col].map(position_map).fillna("Unknown")
-            entries_df[team_col] = entries_df[col].map(team_map).fillna("Unknown")
-
-        def assign_roles(row):
-            roles = {"QB Pick": None, "RB1 Pick": None, "WR1 Pick": None, "WR2 Pick": None, "TE Pick": None, "Flex Pick": None}
-            rb_count = wr_count = 0
-            used_slots = set()
-            for i in range(1, 7):
-                pos = row[f"Pos {i}"]
-                slot = i
-                if pos == "QB" and not roles["QB Pick"]:
-                    roles["QB Pick"] = slot; used_slots.add(slot)
-                elif pos == "RB" and rb_count < 1:
-                    roles["RB1 Pick"] = slot; rb_count += 1; used_slots.add(slot)
-                elif pos == "WR" and wr_count < 2:
-                    if not roles["WR1 Pick"]: roles["WR1 Pick"] = slot
-                    else: roles["WR2 Pick"] = slot
-                    wr_count += 1; used_slots.add(slot)
-                elif pos == "TE" and not roles["TE Pick"]:
-                    roles["TE Pick"] = slot; used_slots.add(slot)
-            for i in range(1, 7):
-                pos = row[f"Pos {i}"]
-                slot = i
-                if slot not in used_slots and pos in ["RB", "WR", "TE"]:
-                    roles["Flex Pick"] = slot
-                    break
-            return pd.Series(roles)
-
-        entries_df = pd.concat([entries_df, entries_df.apply(assign_roles, axis=1)], axis=1)
-        entries_df["Total Entries"] = entries_df.groupby("username")["username"].transform("count")
-
-        def tag_percentile_tiers(df):
-            def tag_group(group):
-                total = len(group)
-                group["Top_0.1%"] = group["place"].astype(int) <= max(1, round(0.001 * total))
-                group["Top_0.5%"] = group["place"].astype(int) <= max(1, round(0.005 * total))
-                group["Top_1%"] = group["place"].astype(int) <= max(1, round(0.01 * total))
-                return group
-            return df.groupby("Week", group_keys=False).apply(tag_group)
-
-        entries_df = tag_percentile_tiers(entries_df)
-
-        # 🔹 Tabs
-        tab1, tab2, tab3, tab4, tab5, tab6, tab7 = st.tabs(["📊 Dashboard", "🔥 Heatmap", "🧠 Round 1 Anchor Analysis", "🔗 Player Combos", "🏅 Player Elite Rates", "🧱 Stacking Analysis", "🧠 Stacking Combinations"])
-
-        # 📊 TAB 1: User-Level Dashboard
-        with tab1:
-            st.header("📊 User-Level Elite Finish Dashboard")
-
-            selected_week = st.selectbox("Filter by Week", ["All Weeks"] + sorted(entries_df["Week"].unique()))
-            filtered_df = entries_df.copy()
-            if selected_week != "All Weeks":
-                filtered_df = filtered_df[filtered_df["Week"] == selected_week]
-
-            selected_user = st.text_input("Username (optional)")
-            min_entries = st.slider("Minimum Entries", 0, int(entries_df["Total Entries"].max()), 0)
-            sort_mode = st.radio("Sort by", ["Elite Finish Count", "Elite Finish Rate"])
-
-            user_summary = (
-                filtered_df.groupby("username")[["Top_0.1%", "Top_0.5%", "Top_1%"]]
-                .sum()
-                .astype(int)
-                .join(filtered_df["username"].value_counts().rename("Total Entries"))
-                .reset_index()
-                .rename(columns={"index": "username"})
-            )
-
-            user_summary["Top 0.1% Rate"] = user_summary["Top_0.1%"] / user_summary["Total Entries"]
-            user_summary["Top 0.5% Rate"] = user_summary["Top_0.5%"] / user_summary["Total Entries"]
-            user_summary["Top 1% Rate"] = user_summary["Top_1%"] / user_summary["Total Entries"]
-
-            filtered = user_summary[user_summary["Total Entries"] >= min_entries]
-            if selected_user:
-                filtered = filtered[filtered["username"].str.lower() == selected_user.lower()]
-
-            sort_cols = ["Top_0.1%", "Top_0.5%", "Top_1%"] if sort_mode == "Elite Finish Count" else ["Top 0.1% Rate", "Top 0.5% Rate", "Top 1% Rate"]
-            st.dataframe(
-                filtered.sort_values(by=sort_cols, ascending=False)
-                .style.format({
-                    "Top 0.1% Rate": "{:.2%}",
-                    "Top 0.5% Rate": "{:.2%}",
-                    "Top 1% Rate": "{:.2%}"
-                })
-            )
-
-            st.download_button("📤 Export Filtered Table", filtered.to_csv(index=False), "filtered_user_summary.csv")
-
-        # 🔥 TAB 2: Heatmap
-        with tab2:
-            st.header("🔥 Heatmap: Draft Position Frequency by Round")
-
-            tier_option = st.selectbox("Heatmap Percentile Tier", ["All Entries", "Top 1%", "Top 0.5%", "Top 0.1%"])
-            week_option = st.selectbox("Heatmap Week Filter", ["All Weeks"] + sorted(entries_df["Week"].unique()))
-            heatmap_user = st.text_input("Heatmap Username Filter (optional)")
-
-            heatmap_df = entries_df.copy()
-            if week_option != "All Weeks":
-                heatmap_df = heatmap_df[heatmap_df["Week"] == week_option]
-            if tier_option == "Top 1%":
-                heatmap_df = heatmap_df[heatmap_df["Top_1%"]]
-            elif tier_option == "Top 0.5%":
-                heatmap_df = heatmap_df[heatmap_df["Top_0.5%"]]
-            elif tier_option == "Top 0.1%":
-                heatmap_df = heatmap_df[heatmap_df["Top_0.1%"]]
-            if heatmap_user:
-                heatmap_df = heatmap_df[heatmap_df["username"].str.lower() == heatmap_user.lower()]
-
-            melted = heatmap_df.melt(
-                value_vars=[f"Pos {i}" for i in range(1, 7)],
-                var_name="Round",
-                value_name="Position"
-            )
-            melted["Round"] = melted["Round"].str.extract(r"(\d)").astype(int)
-
-            heatmap_data = (
-                melted.groupby(["Round", "Position"])
-                .size()
-                .reset_index(name="Count")
-                .pivot(index="Round", columns="Position", values="Count")
-                .fillna(0)
-            )
-
-            fig, ax = plt.subplots(figsize=(8, 4.5))
-            sns.heatmap(heatmap_data, annot=True, fmt=".0f", cmap="Blues", ax=ax)
-            ax.set_title(f"{tier_option} — {week_option} Draft Position Frequency")
-            st.pyplot(fig)
-        
-        with tab3:
-            st.header("🧠 Round 1 Anchor Analysis")
-
-            anchor_pos = st.selectbox("Select Round 1 Anchor Position", ["RB", "WR", "QB", "TE"])
-            tier_filter = st.selectbox("Anchor Percentile Tier", ["All Entries", "Top 1%", "Top 0.5%", "Top 0.1%"])
-            week_filter = st.selectbox("Anchor Week Filter", ["All Weeks"] + sorted(entries_df["Week"].unique()))
-            user_filter = st.text_input("Username Filter (optional)")
-
-            anchor_df = entries_df.copy()
-            if week_filter != "All Weeks":
-                anchor_df = anchor_df[anchor_df["Week"] == week_filter]
-            if tier_filter == "Top 1%":
-                anchor_df = anchor_df[anchor_df["Top_1%"]]
-            elif tier_filter == "Top 0.5%":
-                anchor_df = anchor_df[anchor_df["Top_0.5%"]]
-            elif tier_filter == "Top 0.1%":
-                anchor_df = anchor_df[anchor_df["Top_0.1%"]]
-            if user_filter:
-                anchor_df = anchor_df[anchor_df["username"].str.lower() == user_filter.lower()]
-
-            anchor_df = anchor_df[anchor_df["Pos 1"] == anchor_pos]
-
-            melted = anchor_df.melt(
-                value_vars=[f"Pos {i}" for i in range(2, 7)],
-                var_name="Round",
-                value_name="Position"
-            )
-            melted["Round"] = melted["Round"].str.extract(r"(\d)").astype(int)
-        
-            round_counts = (
-                melted.groupby(["Round", "Position"])
-                .size()
-                .reset_index(name="Count")
-                .pivot(index="Round", columns="Position", values="Count")
-                .fillna(0)
-            )
-
-            # 🔄 Convert to percentages
-            round_percentages = round_counts.div(round_counts.sum(axis=1), axis=0) * 100
-
-            # 📊 Plot with labels
-            fig, ax = plt.subplots(figsize=(8, 4.5))
-            bars = round_percentages.plot(kind="bar", stacked=True, ax=ax, colormap="tab20")
-        
-            for container in ax.containers:
-                ax.bar_label(container, fmt="%.1f%%", label_type="center", fontsize=8)
-        
-            ax.set_title(f"Draft Flow After Round 1 {anchor_pos} — {tier_filter} — {week_filter}")
-            ax.set_xlabel("Draft Round")
-            ax.set_ylabel("Percentage of Teams")
-            ax.grid(axis="y")
-            st.pyplot(fig)
-        
-
-        # 🔗 TAB 4: High-Impact Player Combos
-        with tab4:
-            st.header("🔗 High-Impact Player Combos")
-
-            week_combo = st.selectbox("Combo Week Filter", ["All Weeks"] + sorted(entries_df["Week"].unique()))
-            tier_combo = st.selectbox("Combo Percentile Tier", ["Top 1%", "Top 0.5%", "Top 0.1%"])
-
-            combo_df = entries_df.copy()
-            if week_combo != "All Weeks":
-                combo_df = combo_df[combo_df["Week"] == week_combo]
-            if tier_combo == "Top 1%":
-                top_df = combo_df[combo_df["Top_1%"]]
-            elif tier_combo == "Top 0.5%":
-                top_df = combo_df[combo_df["Top_0.5%"]]
-            elif tier_combo == "Top 0.1%":
-                top_df = combo_df[combo_df["Top_0.1%"]]
-
-            combo_records = []
-            for _, row in top_df.iterrows():
-                players = [row[f"Player {i}"] for i in range(1, 7)]
-                for pair in combinations(sorted(players), 2):
-                    combo_records.append(tuple(pair))
-            top_combo_counts = pd.Series(combo_records).value_counts().rename("Top Tier")
-
-            combo_records_all = []
-            for _, row in combo_df.iterrows():
-                players = [row[f"Player {i}"] for i in range(1, 7)]
-                for pair in combinations(sorted(players), 2):
-                    combo_records_all.append(tuple(pair))
-            all_combo_counts = pd.Series(combo_records_all).value_counts().rename("All Entries")
-
-            combo_table = pd.concat([top_combo_counts, all_combo_counts], axis=1).fillna(0)
-            combo_table["Elite Hit Rate (%)"] = (combo_table["Top Tier"] / combo_table["All Entries"]) * 100
-            combo_table = combo_table.reset_index().rename(columns={"index": "Combo"})
-            combo_table[["Player A", "Player B"]] = pd.DataFrame(combo_table["Combo"].tolist(), index=combo_table.index)
-            combo_table = combo_table[["Player A", "Player B", "Top Tier", "All Entries", "Elite Hit Rate (%)"]]
-            combo_table = combo_table.sort_values("Elite Hit Rate (%)", ascending=False)
-
-            st.dataframe(combo_table.style.format({"Elite Hit Rate (%)": "{:.2f}"}))
-
-        # 🏅 TAB 5: Player-Level Elite Finish Rates
-        with tab5:
-            st.header("🏅 Player-Level Elite Finish Rates")
-
-            round_filter = st.selectbox("Filter by Draft Round", ["All Rounds"] + [f"Player {i}" for i in range(1, 7)])
-            tier_filter = st.selectbox("Player Percentile Tier", ["All Entries", "Top 1%", "Top 0.5%", "Top 0.1%"])
-            week_filter = st.selectbox("Player Week Filter", ["All Weeks"] + sorted(entries_df["Week"].unique()))
-
-            player_df = entries_df.copy()
-            if week_filter != "All Weeks":
-                player_df = player_df[player_df["Week"] == week_filter]
-            if tier_filter == "Top 1%":
-                player_df = player_df[player_df["Top_1%"]]
-            elif tier_filter == "Top 0.5%":
-                player_df = player_df[player_df["Top_0.5%"]]
-            elif tier_filter == "Top 0.1%":
-                player_df = player_df[player_df["Top_0.1%"]]
-
-            player_records = []
-            for _, row in player_df.iterrows():
-                for i in range(1, 7):
-                    player = row[f"Player {i}"]
-                    round_slot = f"Player {i}"
-                    player_records.append({
-                        "Player": player,
-                        "Round": round_slot,
-                        "Top_0.1%": row["Top_0.1%"],
-                        "Top_0.5%": row["Top_0.5%"],
-                        "Top_1%": row["Top_1%"]
-                    })
-
-            player_stats = pd.DataFrame(player_records)
-            if round_filter != "All Rounds":
-                player_stats = player_stats[player_stats["Round"] == round_filter]
-        
-            summary = (
-                player_stats.groupby("Player")[["Top_0.1%", "Top_0.5%", "Top_1%"]]
-                .sum()
-                .astype(int)
-                .join(player_stats["Player"].value_counts().rename("Total Appearances"))
-            )
-            min_appearances = st.slider("Minimum Times Drafted", 0, int(summary["Total Appearances"].max()), 0)
-            summary = summary[summary["Total Appearances"] >= min_appearances]
-
-            summary["Top 0.1% Rate"] = summary["Top_0.1%"] / summary["Total Appearances"]
-            summary["Top 0.5% Rate"] = summary["Top_0.5%"] / summary["Total Appearances"]
-            summary["Top 1% Rate"] = summary["Top_1%"] / summary["Total Appearances"]
-        
-            summary = summary.sort_values("Top 1% Rate", ascending=False)
-        
-            st.dataframe(summary.style.format({
-                "Top 0.1% Rate": "{:.2%}",
-                "Top 0.5% Rate": "{:.2%}",
-                "Top 1% Rate": "{:.2%}"
-            }))
-        # 🧱 TAB 6: Stacking Analysis
-        with tab6:
-            st.header("🧱 Stacking Analysis: Teammate Impact on Elite Finishes")
-
-            stack_week = st.selectbox("Stack Week Filter", ["All Weeks"] + sorted(entries_df["Week"].unique()))
-            stack_tier = st.selectbox("Stack Percentile Tier", ["Top 1%", "Top 0.5%", "Top 0.1%"])
-
-            stack_df = entries_df.copy()
-            if stack_week != "All Weeks":
-                stack_df = stack_df[stack_df["Week"] == stack_week]
-
-            # Flag stacked entries
-            def detect_stack(row):
-                teams = [row[f"Team {i}"] for i in range(1, 7)]
-                return len(set(teams)) < 6  # True if any teammates exist
-
-            stack_df["Stacked"] = stack_df.apply(detect_stack, axis=1)
-
-            # Apply tier filter
-            if stack_tier == "Top 1%":
-                stack_df["Elite"] = stack_df["Top_1%"]
-            elif stack_tier == "Top 0.5%":
-                stack_df["Elite"] = stack_df["Top_0.5%"]
-            elif stack_tier == "Top 0.1%":
-                stack_df["Elite"] = stack_df["Top_0.1%"]
-
-            summary = (
-                stack_df.groupby("Stacked")[["Elite"]]
-                .agg(["count", "sum"])
-                .droplevel(0, axis=1)
-                .rename(columns={"count": "Entry Count", "sum": "Elite Hits"})
-            )
-            summary["Elite Hit Rate (%)"] = (summary["Elite Hits"] / summary["Entry Count"]) * 100
-            summary = summary.reset_index().replace({True: "Stacked", False: "Unstacked"})
-
-            st.dataframe(summary.style.format({"Elite Hit Rate (%)": "{:.2f}"}))
-
-        with tab7:
-            st.header("🧠 Stacking Combinations: QB + Teammates vs Mini Stacks")
-
-            stack_week = st.selectbox("Stack Combo Week Filter", ["All Weeks"] + sorted(entries_df["Week"].unique()))
-            stack_tier = st.selectbox("Stack Combo Percentile Tier", ["Top 1%", "Top 0.5%", "Top 0.1%"])
-
-            df = entries_df.copy()
-            if stack_week != "All Weeks":
-                df = df[df["Week"] == stack_week]
-
-            # Apply tier filter
-            if stack_tier == "Top 1%":
-                df["Elite"] = df["Top_1%"]
-            elif stack_tier == "Top 0.5%":
-                df["Elite"] = df["Top_0.5%"]
-            elif stack_tier == "Top 0.1%":
-                df["Elite"] = df["Top_0.1%"]
-
-            def classify_stack(row):
-                teams = [row[f"Team {i}"] for i in range(1, 7)]
-                positions = [row[f"Pos {i}"] for i in range(1, 7)]
-                team_counts = pd.Series(teams).value_counts()
-                has_qb_stack = False
-                has_mini_stack = False
-                for team, count in team_counts.items():
-                    if count >= 2:
-                        qbs = [i for i in range(6) if teams[i] == team and positions[i] == "QB"]
-                        if qbs:
-                            has_qb_stack = True
-                        else:
-                            has_mini_stack = True
-                if has_qb_stack:
-                    return "QB Stack"
-                elif has_mini_stack:
-                    return "Mini Stack"
+        show_result_table(scan["combos"], f"scan{i}_combos", "Elite Hit Rate (%)", {"Elite Hit Rate (%)": "{:.2f}"})
+
+        st.subheader("🔗 High-Impact 3-Player Combos")
+        show_result_table(scan["triples"], f"scan{i}_triples", "Top 1% Hit Rate (%)", {"Top 1% Hit Rate (%)": "{:.2f}"})
+
+try:
+    # 🔹 Dashboard Mode
+    if mode == "Dashboard":
+        season_store = SeasonStore(store_dir) if store_dir and SeasonStore.exists(store_dir) else None
+        if store_dir and season_store is None:
+            st.sidebar.warning(f"No season store found at {store_dir}")
+
+        if season_store is not None or (uploaded_weeks and uploaded_positions):
+            # 🔹 Load and process data (season store first, else uploads cached on file contents)
+            with stage("load_dataset") as record:
+                if season_store is not None:
+                    dataset_key = season_store.fingerprint()
+                    entries_df = get_store_entries(dataset_key, season_store)
                 else:
-                    return "Unstacked"
-
-            df["Stack Type"] = df.apply(classify_stack, axis=1)
-        
-            summary = (
-                df.groupby("Stack Type")[["Elite"]]
-                .agg(["count", "sum"])
-                .droplevel(0, axis=1)
-                .rename(columns={"count": "Entry Count", "sum": "Elite Hits"})
-            )
-            summary["Elite Hit Rate (%)"] = (summary["Elite Hits"] / summary["Entry Count"]) * 100
-            summary["Stack Prevalence (%)"] = (summary["Entry Count"] / len(df)) * 100
-            summary = summary.reset_index()
-        
-            st.dataframe(summary.style.format({
-                "Elite Hit Rate (%)": "{:.2f}",
-                "Stack Prevalence (%)": "{:.2f}"
-            }))
-            
-            st.subheader("🔗 Player-Level Stack Combinations")
-
-            combo_records = []
-            for _, row in df.iterrows():
-                players = [row[f"Player {i}"] for i in range(1, 7)]
-                teams = [row[f"Team {i}"] for i in range(1, 7)]
-                positions = [row[f"Pos {i}"] for i in range(1, 7)]
-                for i in range(6):
-                    for j in range(i + 1, 6):
-                        if teams[i] == teams[j] and teams[i] != "Unknown":
-                            combo_type = "QB Stack" if "QB" in [positions[i], positions[j]] else "Mini Stack"
-                            combo_records.append({
-                                "Player A": players[i],
-                                "Player B": players[j],
-                                "Combo Type": combo_type,
-                                "Elite_1%": row["Top_1%"],
-                                "Elite_0.5%": row["Top_0.5%"],
-                                "Elite_0.1%": row["Top_0.1%"]
-                            })
-
-            combo_df = pd.DataFrame(combo_records)
-            combo_df["Combo"] = combo_df.apply(lambda x: tuple(sorted([x["Player A"], x["Player B"]])), axis=1)
-            
-            summary = (
-                combo_df.groupby(["Combo", "Combo Type"])[["Elite_1%", "Elite_0.5%", "Elite_0.1%"]]
-                .sum()
-                .astype(int)
-                .join(combo_df["Combo"].value_counts().rename("Total Entries"))
-                .reset_index()
+                    dataset_key = content_key(uploaded_weeks, uploaded_positions)
+                    entries_df = load_entries(
+                        uploaded_weeks, uploaded_positions, cache=get_entries_cache(), key=dataset_key, compact=True
+                    )
+                record["rows"] = len(entries_df)
+            stack_engine = get_stack_engine(dataset_key, entries_df)
+            cubes = get_aggregate_cubes(dataset_key, entries_df, stack_engine)
+            entry_index = get_entry_index(dataset_key, entries_df)
+            views = get_view_cache()
+            week_options = ["All Weeks"] + sorted(entries_df["Week"].unique())
+
+            # 🔹 Tabs (only the selected tab runs; each view is memoized on its own filters)
+            tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs(
+                ["📊 Dashboard", "🔥 Heatmap", "🧠 Round 1 Anchor Analysis", "🔗 Player Combos", "🏅 Player Elite Rates", "🧱 Stacking Analysis", "🧠 Stacking Combinations", "🔎 Entry Search", "📈 Trends"],
+                key="dashboard_tab",
+                on_change="rerun",
             )
-            
-            summary[["Player A", "Player B"]] = pd.DataFrame(summary["Combo"].tolist(), index=summary.index)
-            summary["Top 1% Rate"] = summary["Elite_1%"] / summary["Total Entries"]
-            summary["Top 0.5% Rate"] = summary["Elite_0.5%"] / summary["Total Entries"]
-            summary["Top 0.1% Rate"] = summary["Elite_0.1%"] / summary["Total Entries"]
-            
-            summary = summary[[
-                "Player A", "Player B", "Combo Type", "Total Entries",
-                "Elite_1%", "Elite_0.5%", "Elite_0.1%",
-                "Top 1% Rate", "Top 0.5% Rate", "Top 0.1% Rate"
-            ]]
-
-            min_combo_entries = st.slider("Minimum Combo Drafts", 0, int(summary["Total Entries"].max()), 0)
-            summary = summary[summary["Total Entries"] >= min_combo_entries]
-            summary = summary.sort_values("Top 1% Rate", ascending=False)
-
-            st.dataframe(summary.style.format({
-                "Top 1% Rate": "{:.2%}",
-                "Top 0.5% Rate": "{:.2%}",
-                "Top 0.1% Rate": "{:.2%}"
-            }))
-
-            
-                            
-            
+
+            # 📊 TAB 1: User-Level Dashboard
+            if tab1.open:
+                with tab1:
+                    st.header("📊 User-Level Elite Finish Dashboard")
+
+                    selected_week = st.selectbox("Filter by Week", week_options)
+
+                    selected_user = st.text_input("Username (optional)")
+                    min_entries = st.slider("Minimum Entries", 0, int(entries_df["Total Entries"].max()), 0)
+                    sort_mode = st.radio("Sort by", ["Elite Finish Count", "Elite Finish Rate"])
+
+                    user_summary = views.get(
+                        "tab1_user_summary", (dataset_key, selected_week), lambda: user_table(cubes, selected_week)
+                    )
+
+                    filtered = user_summary[user_summary["Total Entries"] >= min_entries]
+                    if selected_user:
+                        filtered = filtered[filtered["username"].str.lower() == selected_user.lower()]
+
+                    sort_cols = FLAG_COLUMNS if sort_mode == "Elite Finish Count" else RATE_COLUMNS
+                    st.dataframe(
+                        filtered.sort_values(by=sort_cols, ascending=False)
+                        .style.format({rate_col: "{:.2%}" for rate_col in RATE_COLUMNS})
+                    )
+
+                    st.download_button("📤 Export Filtered Table", filtered.to_csv(index=False), "filtered_user_summary.csv")
+
+            # 🔥 TAB 2: Heatmap
+            if tab2.open:
+                with tab2:
+                    st.header("🔥 Heatmap: Draft Position Frequency by Round")
+
+                    tier_option = st.selectbox("Heatmap Percentile Tier", ["All Entries"] + list(TIER_COLUMNS))
+                    week_option = st.selectbox("Heatmap Week Filter", week_options)
+                    heatmap_user = st.text_input("Heatmap Username Filter (optional)")
+
+                    heatmap_data = views.get(
+                        "tab2_heatmap",
+                        (dataset_key, week_option, tier_option, heatmap_user.lower()),
+                        lambda: heatmap_counts(cubes, week_option, tier_option, heatmap_user, entries_df, entry_index),
+                    )
+
+                    if heatmap_data.empty:
+                        st.info("No entries match these filters.")
+                    else:
+                        with stage("tab2_render"):
+                            show_chart(
+                                "tab2_heatmap",
+                                heatmap_data,
+                                f"{tier_option} — {week_option} Draft Position Frequency",
+                                heatmap_png,
+                                heatmap_spec,
+                            )
+
+            if tab3.open:
+                with tab3:
+                    st.header("🧠 Round 1 Anchor Analysis")
+
+                    anchor_pos = st.selectbox("Select Round 1 Anchor Position", ["RB", "WR", "QB", "TE"])
+                    tier_filter = st.selectbox("Anchor Percentile Tier", ["All Entries"] + list(TIER_COLUMNS))
+                    week_filter = st.selectbox("Anchor Week Filter", week_options)
+                    user_filter = st.text_input("Username Filter (optional)")
+
+                    # 🔄 Counts converted to percentages
+                    round_percentages = views.get(
+                        "tab3_anchor_flow",
+                        (dataset_key, anchor_pos, week_filter, tier_filter, user_filter.lower()),
+                        lambda: anchor_flow(
+                            anchor_counts(cubes, anchor_pos, week_filter, tier_filter, user_filter, entries_df, entry_index)
+                        ),
+                    )
+
+                    # 📊 Plot with labels
+                    if round_percentages.empty:
+                        st.info("No entries match these filters.")
+                    else:
+                        with stage("tab3_render"):
+                            show_chart(
+                                "tab3_anchor_flow",
+                                round_percentages,
+                                f"Draft Flow After Round 1 {anchor_pos} — {tier_filter} — {week_filter}",
+                                anchor_flow_png,
+                                anchor_flow_spec,
+                            )
+
+            # 🔗 TAB 4: High-Impact Player Combos
+            if tab4.open:
+                with tab4:
+                    st.header("🔗 High-Impact Player Combos")
+
+                    combo_size = st.radio("Combo Size", [2, 3, 4], horizontal=True)
+                    week_combo = st.selectbox("Combo Week Filter", week_options)
+
+                    week_mask = None
+                    if week_combo != "All Weeks":
+                        week_mask = entry_index.mask(week=week_combo)
+
+                    if combo_size == 2:
+                        tier_combo = st.selectbox("Combo Percentile Tier", list(TIER_COLUMNS))
+                        min_support = st.number_input("Minimum Combo Drafts", min_value=1, value=1)
+
+                        combo_table = views.get(
+                            "tab4_pair_combos",
+                            (dataset_key, week_combo, tier_combo, min_support),
+                            lambda: get_combo_matrix(dataset_key, entries_df).combo_table(
+                                entries_df[TIER_COLUMNS[tier_combo]].to_numpy(), base_mask=week_mask, min_support=min_support
+                            ),
+                        )
+
+                        show_result_table(combo_table, "tab4_pairs", "Elite Hit Rate (%)", {"Elite Hit Rate (%)": "{:.2f}"})
+                    else:
+                        min_support = st.number_input("Minimum Combo Drafts", min_value=1, value=10)
+                        same_team_only = st.checkbox("Same-team stacks only")
+
+                        combo_table = views.get(
+                            f"tab4_combos_of_{combo_size}",
+                            (dataset_key, week_combo, min_support),
+                            lambda: get_combo_miner(dataset_key, entries_df).combo_table(
+                                combo_size, tier_label_masks(entries_df), min_support=min_support, base_mask=week_mask
+                            ),
+                        )
+                        if same_team_only:
+                            combo_table = combo_table[combo_table["Same Team"]]
+
+                        rate_cols = [f"{label} Hit Rate (%)" for label in TIER_COLUMNS]
+                        show_result_table(
+                            combo_table, f"tab4_combos_{combo_size}", rate_cols[0], {col: "{:.2f}" for col in rate_cols}
+                        )
+
+            # 🏅 TAB 5: Player-Level Elite Finish Rates
+            if tab5.open:
+                with tab5:
+                    st.header("🏅 Player-Level Elite Finish Rates")
+
+                    round_filter = st.selectbox("Filter by Draft Round", ["All Rounds"] + [f"Player {i}" for i in range(1, 7)])
+                    tier_filter = st.selectbox("Player Percentile Tier", ["All Entries"] + list(TIER_COLUMNS))
+                    week_filter = st.selectbox("Player Week Filter", week_options)
+
+                    summary = views.get(
+                        "tab5_player_rates",
+                        (dataset_key, week_filter, tier_filter, round_filter),
+                        lambda: player_rate_table(cubes, week_filter, tier_filter, round_filter),
+                    )
+                    min_appearances = st.slider("Minimum Times Drafted", 0, int(summary["Total Appearances"].max()), 0)
+                    summary = summary[summary["Total Appearances"] >= min_appearances]
+
+                    st.dataframe(summary.style.format({rate_col: "{:.2%}" for rate_col in RATE_COLUMNS}))
+
+            # 🧱 TAB 6: Stacking Analysis
+            if tab6.open:
+                with tab6:
+                    st.header("🧱 Stacking Analysis: Teammate Impact on Elite Finishes")
+
+                    stack_week = st.selectbox("Stack Week Filter", week_options)
+                    stack_tier = st.selectbox("Stack Percentile Tier", list(TIER_COLUMNS))
+
+                    summary = views.get(
+                        "tab6_stacking", (dataset_key, stack_week, stack_tier), lambda: stack_table(cubes, stack_week, stack_tier)
+                    )
+
+                    st.dataframe(summary.style.format({"Elite Hit Rate (%)": "{:.2f}"}))
+
+            if tab7.open:
+                with tab7:
+                    st.header("🧠 Stacking Combinations: QB + Teammates vs Mini Stacks")
+
+                    stack_week = st.selectbox("Stack Combo Week Filter", week_options)
+                    stack_tier = st.selectbox("Stack Combo Percentile Tier", list(TIER_COLUMNS))
+
+                    summary = views.get(
+                        "tab7_stack_types",
+                        (dataset_key, stack_week, stack_tier),
+                        lambda: stack_type_table(cubes, stack_week, stack_tier),
+                    )
+
+                    st.dataframe(summary.style.format({
+                        "Elite Hit Rate (%)": "{:.2f}",
+                        "Stack Prevalence (%)": "{:.2f}"
+                    }))
+
+                    st.subheader("🔗 Player-Level Stack Combinations")
+
+                    min_combo_entries = st.number_input("Minimum Combo Drafts", min_value=1, value=1, key="tab7_min_support")
+
+                    summary = views.get(
+                        "tab7_stack_pairs",
+                        (dataset_key, stack_week, min_combo_entries),
+                        lambda: stack_pair_table(
+                            stack_engine,
+                            elite_masks(entries_df),
+                            base_mask=None if stack_week == "All Weeks" else entry_index.mask(week=stack_week),
+                            min_support=min_combo_entries,
+                        ),
+                    )
+
+                    show_result_table(summary, "tab7_pairs", "Top 1% Rate", {f"{label} Rate": "{:.2%}" for label in TIER_COLUMNS})
+
+            # 🔎 TAB 8: Entry Search
+            if tab8.open:
+                with tab8:
+                    st.header("🔎 Entry Search: Every Entry Containing a Player")
+
+                    search_players = st.multiselect("Players (entries must contain all)", sorted(entry_index.players))
+                    search_teams = st.multiselect("Teams (entries must contain all)", sorted(entry_index.teams))
+                    search_week = st.selectbox("Search Week Filter", week_options)
+                    search_user = st.text_input("Search Username Filter (optional)")
+
+                    if search_players or search_teams or search_user:
+                        # Cache only the matching row IDs; the rows themselves are taken per run
+                        match_rows = views.get(
+                            "tab8_entry_search",
+                            (dataset_key, tuple(search_players), tuple(search_teams), search_week, search_user.lower()),
+                            lambda: entry_index.rows(
+                                user=search_user, players=search_players, teams=search_teams, week=search_week
+                            ),
+                        )
+                        matches = entries_df.iloc[match_rows]
+
+                        hits = "  \n".join(
+                            f"**{label}:** {int(matches[col].sum())} ({matches[col].mean() if len(matches) else 0:.2%})"
+                            for label, col in TIER_COLUMNS.items()
+                        )
+                        st.markdown(f"**Matching Entries:** {len(matches)}  \n{hits}")
+                        show_result_table(matches, "tab8_matches", "points")
+                    else:
+                        st.info("Pick at least one player, team or username to search entries.")
+
+            # 📈 TAB 9: Cross-Week Trends
+            if tab9.open:
+                with tab9:
+                    st.header("📈 Cross-Week Trends: Rolling 3-Week Elite Rates")
+
+                    # One engine per dataset; weeks already aggregated for another dataset are reused by fingerprint
+                    fingerprints = views.get(
+                        "tab9_week_fingerprints",
+                        dataset_key,
+                        lambda: season_store.week_fingerprints()
+                        if season_store is not None
+                        else week_fingerprints(uploaded_weeks, uploaded_positions),
+                    )
+                    trend_engine = get_trend_engine(dataset_key, entries_df, fingerprints)
+
+                    trend_level = st.radio("Trend Level", ["Players", "Combos", "Users"], horizontal=True)
+                    trend_tier = st.selectbox("Trend Percentile Tier", list(TIER_COLUMNS))
+                    min_rolling = st.number_input("Minimum Rolling Drafts", min_value=1, value=10)
+
+                    trends = views.get(
+                        "tab9_trends",
+                        (dataset_key, trend_level, trend_tier, min_rolling),
+                        lambda: trend_engine.trend_table(trend_level.lower(), trend_tier, min_rolling),
+                    )
+                    if trends.empty:
+                        st.info("No rows meet the minimum rolling drafts.")
+                    else:
+                        if trend_level == "Combos":
+                            trends = trends.assign(Combo=trends["Player A"] + " + " + trends["Player B"])
+                        label = {"Players": "Player", "Combos": "Combo", "Users": "username"}[trend_level]
+
+                        trend_week = st.selectbox("Trend Week", trend_engine.weeks, index=len(trend_engine.weeks) - 1)
+                        week_trends = trends[trends["Week"] == trend_week]
+                        leaders = week_trends.nlargest(5, "Rolling Entries")[label].tolist()
+                        selected = st.multiselect(f"Chart {label}s", sorted(trends[label].unique()), default=leaders)
+
+                        if selected:
+                            chart = trends[trends[label].isin(selected)].pivot(
+                                index="Week", columns=label, values="Rolling Hit Rate (%)"
+                            )
+                            st.line_chart(chart.reindex(trend_engine.weeks))
+
+                        formats = {"Rolling Hit Rate (%)": "{:.2f}", "Ownership (%)": "{:.2f}", "Ownership Δ (pp)": "{:+.2f}"}
+                        show_result_table(
+                            week_trends.drop(columns="Week"),
+                            "tab9_trends",
+                            "Rolling Hit Rate (%)",
+                            {col: fmt for col, fmt in formats.items() if col in week_trends},
+                        )
+
+    # 🏆 Elite Trait Scanner Mode
+    elif mode == "Elite Trait Scanner":
+        run_trait_scanner(uploaded_weeks)
+finally:
+    # Release memory tracing even when a rerun or an exception stops this run early
+    if recorder is not None:
+        recorder.close()
+
+# ⏱️ Performance panel
+if recorder is not None:
+    with st.sidebar.expander("⏱️ Performance", expanded=True):
+        st.markdown(f"**Total recorded:** {recorder.total_seconds():.2f} s")
+        if recorder.memory_refused:
+            st.caption("Peak memory not traced: another session is already tracing memory on this server.")
+        st.dataframe(recorder.frame().style.format({"Seconds": "{:.3f}", "Peak MB": "{:.1f}", "Rows": "{:.0f}"}, na_rep=""))
+    if perf_log:
+        recorder.write_log(perf_log, mode=mode)